@@ -3,7 +3,6 @@
 
 import os
 import sys
-import subprocess
 import argparse
 
 
@@ -85,13 +84,13 @@ Examples:
 
     print()
 
-    # Run the server
+    # Replace the launcher with the server process rather than waiting on
+    # a child, so no idle parent lingers for the server's lifetime.
+    # Flush first: exec discards anything still buffered in this process
+    sys.stdout.flush()
     try:
-        subprocess.run(cmd)
-    except KeyboardInterrupt:
-        print("\n✋ Server stopped")
-        sys.exit(0)
-    except Exception as e:
+        os.execv(sys.executable, cmd)
+    except OSError as e:
         print(f"❌ Error: {e}", file=sys.stderr)
         sys.exit(1)
 
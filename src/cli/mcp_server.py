@@ -2,33 +2,38 @@
 
 import sys
 import os
+import asyncio
 import argparse
+import functools
+import logging
 import threading
 import signal
-from typing import Dict, Any, Optional
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, Any, List, Optional
 
+from cachetools import TTLCache
 from fastmcp import FastMCP
-from models.config import DatabaseConfig
-from models.error_types import MCPError, InvalidTableError
-from models.session_state import get_session_state
-from services.database_service import DatabaseService
-from services.health_api import HealthAPI
-from lib.mcp_tools import (
+from src.models.config import DatabaseConfig
+from src.models.error_types import MCPError, InvalidTableError
+from src.models.session_state import get_session_state
+from src.services.database_service import DatabaseService
+from src.lib.mcp_tools import (
     get_tables, get_columns, get_table_stats, get_column_statistics,
     list_schemas, get_database_stats, get_connection_info,
     inspect_database_object, analyze_query_plan, enumerate_views,
     enumerate_functions, enumerate_indexes, fetch_table_constraints,
     analyze_object_dependencies, execute_query
 )
-from lib.tools.query import extract_table_names_from_query
+from src.lib.tools.query import extract_table_names_from_query, is_plain_explain, normalize_sql
+
+from src.transport.stdio_server import StdioTransport
 
-from transport.stdio_server import StdioTransport
+if TYPE_CHECKING:
+    # FastAPI and uvicorn are only imported when the health API is enabled
+    from src.services.health_api import HealthAPI
 
 # Initialize logging
-from lib.logging_config import setup_logging, get_logger
+from src.lib.logging_config import setup_logging, get_logger
 
 # Setup structured logging
 setup_logging(
@@ -41,14 +46,26 @@ logger = get_logger(__name__)
 # Initialize MCP server
 mcp = FastMCP("PostgreSQL MCP Server")
 
+# The server has one client per process (stdio, or a single SSE agent), so
+# all tools share the process-wide session state; reset() clears it in place
+session_state = get_session_state()
+
 # Global database service instance
 db_service: Optional[DatabaseService] = None
 db_config: Optional[DatabaseConfig] = None
+# Worker threads for blocking database calls. ThreadedConnectionPool raises
+# PoolError instead of waiting when it is empty, so the executor gets one
+# worker per pooled connection minus the ones reserved for database users
+# outside it, and concurrent tool calls never outnumber the connections left
+db_executor: Optional[ThreadPoolExecutor] = None
+# Connections kept back for the health API, which probes the database from
+# its own thread and never holds more than this many at once
+HEALTH_API_RESERVED_CONNECTIONS = 1
 
 
 def initialize_database():
     """Initialize database connection using profile-based configuration."""
-    global db_service, db_config
+    global db_service, db_config, db_executor
     try:
         # Get database profile from environment or use default
         profile_name = os.getenv('DATABASE_PROFILE')
@@ -59,15 +76,139 @@ def initialize_database():
         logger.info(f"Using database profile: {profile_info.get('profile', 'unknown')}")
         logger.info(f"Database: {profile_info.get('host')}:{profile_info.get('port')}/{profile_info.get('database')}")
 
-        db_service = DatabaseService(db_config.to_dict())
+        db_service = DatabaseService(db_config.to_dict(), pool_size=db_config.pool_size)
         db_service.connect()
+        db_executor = ThreadPoolExecutor(
+            max_workers=max(1, db_service.pool_size - HEALTH_API_RESERVED_CONNECTIONS),
+            thread_name_prefix="db"
+        )
+        # Lookups cached against a previous connection may describe another database
+        clear_metadata_cache()
         logger.info("Database connection established")
+        # Prewarming runs on the executor so it shares the tools' connections
+        db_executor.submit(prewarm_metadata_cache)
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
         raise
 
 
+# Catalog metadata is read repeatedly as an agent moves from discovery to
+# inspection, so recent results are reused for a short time. The cache is
+# shared by all tool calls; the lock keeps TTLCache consistent across threads.
+_metadata_cache: TTLCache = TTLCache(maxsize=512, ttl=60)
+_metadata_cache_lock = threading.Lock()
+
+
+def cached_metadata(func: Callable[..., Dict[str, Any]], *args,
+                    key: Optional[tuple] = None) -> Dict[str, Any]:
+    """Call a catalog lookup, reusing a recent result for the same arguments.
+
+    Only successful results are cached; errors propagate and are retried on
+    the next call.
+
+    Args:
+        func: Tool implementation taking the database service first
+        *args: Remaining (hashable) arguments for func
+        key: Cache key to use instead of the arguments, for calls whose
+            arguments have equivalent spellings
+
+    Returns:
+        The lookup result, possibly from the cache
+    """
+    key = (func.__name__, *(args if key is None else key))
+    with _metadata_cache_lock:
+        result = _metadata_cache.get(key)
+    if result is None:
+        result = func(db_service, *args)
+        with _metadata_cache_lock:
+            _metadata_cache[key] = result
+    return result
+
+
+async def run_in_db_thread(func: Callable[..., Any], *args) -> Any:
+    """Run a blocking database call without stalling the event loop.
+
+    The tools use the synchronous psycopg2 driver; running them on the
+    database executor lets other tool calls proceed while a query runs.
+
+    Args:
+        func: Blocking function to call
+        *args: Arguments for func
+
+    Returns:
+        The return value of func
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(db_executor, functools.partial(func, *args))
+
+
+def clear_metadata_cache():
+    """Drop all cached catalog lookups."""
+    with _metadata_cache_lock:
+        _metadata_cache.clear()
+
+
+def prewarm_metadata_cache():
+    """Populate the metadata cache with the lookups an agent makes first.
+
+    Runs on the database executor after connecting, so the first
+    discover_tables/schemas_list/list_views/list_functions calls (with
+    default arguments) are served from the cache. Failures are only logged;
+    the tools simply query on demand instead.
+    """
+    try:
+        cached_metadata(get_tables, None)
+        cached_metadata(list_schemas, False, False)
+        cached_metadata(enumerate_views, None, False)
+        cached_metadata(enumerate_functions, None, False)
+        logger.debug("Metadata cache prewarmed")
+    except Exception as e:
+        logger.warning(f"Metadata cache prewarm failed: {e}")
+
+
+def handle_tool_errors(tool_name: str, suggestion: Optional[str] = None):
+    """Turn exceptions raised by an MCP tool into error response dicts.
+
+    Args:
+        tool_name: Tool name used in log messages
+        suggestion: Optional hint added to invalid-table error responses
+
+    Returns:
+        Decorator wrapping an async tool function
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> Dict[str, Any]:
+            try:
+                return await func(*args, **kwargs)
+            except InvalidTableError as e:
+                logger.error("Invalid table error in %s: %s", tool_name, e)
+                response = {
+                    'error': str(e),
+                    'table_name': e.table_name,
+                    'recoverable': e.recoverable
+                }
+                if suggestion:
+                    response['suggestion'] = suggestion
+                return response
+            except MCPError as e:
+                logger.error("MCP error in %s: %s", tool_name, e)
+                return {
+                    'error': str(e),
+                    'recoverable': e.recoverable
+                }
+            except Exception as e:
+                logger.error("Unexpected error in %s: %s", tool_name, e)
+                return {
+                    'error': f"Unexpected error: {str(e)}",
+                    'recoverable': False
+                }
+        return wrapper
+    return decorator
+
+
 @mcp.tool(name="discover_tables")
+@handle_tool_errors("discover_tables")
 async def list_tables(schema: Optional[str] = None) -> Dict[str, Any]:
     """🔍 STEP 1: Discover available tables - START HERE for any database work.
 
@@ -88,33 +229,17 @@ async def list_tables(schema: Optional[str] = None) -> Dict[str, Any]:
         After discovering tables, use inspect_table_schema to understand table structure
         before running any queries with safe_read_query.
     """
-    try:
-        if not db_service:
-            initialize_database()
+    # Mark tables as discovered in session state
+    session_state.mark_tables_discovered()
 
-        # Mark tables as discovered in session state
-        session = get_session_state()
-        session.mark_tables_discovered()
+    result = await run_in_db_thread(cached_metadata, get_tables, schema)
+    logger.info("Discovered %d tables in schema: %s", result.get('count', 0), schema or 'all')
 
-        result = get_tables(db_service, schema)
-        logger.info(f"Discovered {result.get('count', 0)} tables in schema: {schema or 'all'}")
-
-        return result
-    except MCPError as e:
-        logger.error(f"MCP error in discover_tables: {e}")
-        return {
-            'error': str(e),
-            'recoverable': e.recoverable
-        }
-    except Exception as e:
-        logger.error(f"Unexpected error in discover_tables: {e}")
-        return {
-            'error': f"Unexpected error: {str(e)}",
-            'recoverable': False
-        }
+    return result
 
 
 @mcp.tool(name="inspect_table_schema")
+@handle_tool_errors("inspect_table_schema", suggestion="Use discover_tables to see available tables")
 async def describe_table(table_name: str, schema: Optional[str] = None) -> Dict[str, Any]:
     """📋 STEP 2: Inspect table structure - REQUIRED before safe_read_query.
 
@@ -144,43 +269,18 @@ async def describe_table(table_name: str, schema: Optional[str] = None) -> Dict[
         After inspecting table schema, you can safely use safe_read_query
         to execute SQL queries on this table.
     """
-    try:
-        if not db_service:
-            initialize_database()
+    # Get table schema
+    result = await run_in_db_thread(cached_metadata, get_columns, table_name, schema)
 
-        # Get table schema
-        result = get_columns(db_service, table_name, schema)
-
-        # Track this table as inspected in session state
-        session = get_session_state()
-        session.add_inspected_table(table_name)
-
-        logger.info(f"Inspected table schema: {table_name} ({result.get('column_count', 0)} columns)")
-        return result
+    # Track this table as inspected in session state
+    session_state.add_inspected_table(table_name)
 
-    except InvalidTableError as e:
-        logger.error(f"Invalid table error in inspect_table_schema: {e}")
-        return {
-            'error': str(e),
-            'table_name': e.table_name,
-            'recoverable': e.recoverable,
-            'suggestion': 'Use discover_tables to see available tables'
-        }
-    except MCPError as e:
-        logger.error(f"MCP error in inspect_table_schema: {e}")
-        return {
-            'error': str(e),
-            'recoverable': e.recoverable
-        }
-    except Exception as e:
-        logger.error(f"Unexpected error in inspect_table_schema: {e}")
-        return {
-            'error': f"Unexpected error: {str(e)}",
-            'recoverable': False
-        }
+    logger.info("Inspected table schema: %s (%d columns)", table_name, result.get('column_count', 0))
+    return result
 
 
 @mcp.tool()
+@handle_tool_errors("table_statistics")
 async def table_statistics(table_name: Optional[str] = None,
                           table_names: Optional[list] = None) -> Dict[str, Any]:
     """Get table metadata and storage information (NOT mathematical statistics).
@@ -201,29 +301,7 @@ async def table_statistics(table_name: Optional[str] = None,
         - vacuum/analyze: Maintenance information
         - activity: Scan and update metrics
     """
-    try:
-        if not db_service:
-            initialize_database()
-        return get_table_stats(db_service, table_name, table_names)
-    except InvalidTableError as e:
-        logger.error(f"Invalid table error in table_statistics: {e}")
-        return {
-            'error': str(e),
-            'table_name': e.table_name,
-            'recoverable': e.recoverable
-        }
-    except MCPError as e:
-        logger.error(f"MCP error in table_statistics: {e}")
-        return {
-            'error': str(e),
-            'recoverable': e.recoverable
-        }
-    except Exception as e:
-        logger.error(f"Unexpected error in table_statistics: {e}")
-        return {
-            'error': f"Unexpected error: {str(e)}",
-            'recoverable': False
-        }
+    return await run_in_db_thread(get_table_stats, db_service, table_name, table_names)
 
 
 # ============================================================================
@@ -231,6 +309,7 @@ async def table_statistics(table_name: Optional[str] = None,
 # ============================================================================
 
 @mcp.tool()
+@handle_tool_errors("schemas_list")
 async def schemas_list(include_system: bool = False,
                        include_sizes: bool = False) -> Dict[str, Any]:
     """List all database schemas with ownership and classification.
@@ -245,25 +324,11 @@ async def schemas_list(include_system: bool = False,
         - count: Number of schemas
         - database: Database name
     """
-    try:
-        if not db_service:
-            initialize_database()
-        return list_schemas(db_service, include_system, include_sizes)
-    except MCPError as e:
-        logger.error(f"MCP error in schemas_list: {e}")
-        return {
-            'error': str(e),
-            'recoverable': e.recoverable
-        }
-    except Exception as e:
-        logger.error(f"Unexpected error in schemas_list: {e}")
-        return {
-            'error': f"Unexpected error: {str(e)}",
-            'recoverable': False
-        }
+    return await run_in_db_thread(cached_metadata, list_schemas, include_system, include_sizes)
 
 
 @mcp.tool()
+@handle_tool_errors("database_stats")
 async def database_stats() -> Dict[str, Any]:
     """Get comprehensive database statistics and metrics.
 
@@ -274,25 +339,11 @@ async def database_stats() -> Dict[str, Any]:
         - Cache hit ratio
         - Temporary files usage
     """
-    try:
-        if not db_service:
-            initialize_database()
-        return get_database_stats(db_service)
-    except MCPError as e:
-        logger.error(f"MCP error in database_stats: {e}")
-        return {
-            'error': str(e),
-            'recoverable': e.recoverable
-        }
-    except Exception as e:
-        logger.error(f"Unexpected error in database_stats: {e}")
-        return {
-            'error': f"Unexpected error: {str(e)}",
-            'recoverable': False
-        }
+    return await run_in_db_thread(get_database_stats, db_service)
 
 
 @mcp.tool()
+@handle_tool_errors("connection_info")
 async def connection_info(by_state: bool = True,
                          by_database: bool = False) -> Dict[str, Any]:
     """Get current database connection information and statistics.
@@ -308,25 +359,11 @@ async def connection_info(by_state: bool = True,
         - Per-database connection counts (if requested)
         - Connection saturation warnings
     """
-    try:
-        if not db_service:
-            initialize_database()
-        return get_connection_info(db_service, by_state, by_database)
-    except MCPError as e:
-        logger.error(f"MCP error in connection_info: {e}")
-        return {
-            'error': str(e),
-            'recoverable': e.recoverable
-        }
-    except Exception as e:
-        logger.error(f"Unexpected error in connection_info: {e}")
-        return {
-            'error': f"Unexpected error: {str(e)}",
-            'recoverable': False
-        }
+    return await run_in_db_thread(get_connection_info, db_service, by_state, by_database)
 
 
 @mcp.tool()
+@handle_tool_errors("column_statistics")
 async def column_statistics(table_name: str,
                            column_names: Optional[list] = None,
                            schema: str = 'public',
@@ -353,30 +390,8 @@ async def column_statistics(table_name: str,
         - Distribution: skewness
         - Data quality: null count, distinct values
     """
-    try:
-        if not db_service:
-            initialize_database()
-        return get_column_statistics(db_service, table_name, column_names,
-                                    schema, include_outliers, outlier_method)
-    except InvalidTableError as e:
-        logger.error(f"Invalid table error in column_statistics: {e}")
-        return {
-            'error': str(e),
-            'table_name': e.table_name,
-            'recoverable': e.recoverable
-        }
-    except MCPError as e:
-        logger.error(f"MCP error in column_statistics: {e}")
-        return {
-            'error': str(e),
-            'recoverable': e.recoverable
-        }
-    except Exception as e:
-        logger.error(f"Unexpected error in column_statistics: {e}")
-        return {
-            'error': f"Unexpected error: {str(e)}",
-            'recoverable': False
-        }
+    return await run_in_db_thread(get_column_statistics, db_service, table_name, column_names,
+                                  schema, include_outliers, outlier_method)
 
 
 # ============================================================================
@@ -384,6 +399,7 @@ async def column_statistics(table_name: str,
 # ============================================================================
 
 @mcp.tool()
+@handle_tool_errors("describe_object")
 async def describe_object(object_name: str,
                          object_type: Optional[str] = None,
                          schema: str = 'public') -> Dict[str, Any]:
@@ -405,25 +421,11 @@ async def describe_object(object_name: str,
         - Indexes: columns, type, size
         - Sequences: current value, increment
     """
-    try:
-        if not db_service:
-            initialize_database()
-        return inspect_database_object(db_service, object_name, object_type, schema)
-    except MCPError as e:
-        logger.error(f"MCP error in describe_object: {e}")
-        return {
-            'error': str(e),
-            'recoverable': e.recoverable
-        }
-    except Exception as e:
-        logger.error(f"Unexpected error in describe_object: {e}")
-        return {
-            'error': f"Unexpected error: {str(e)}",
-            'recoverable': False
-        }
+    return await run_in_db_thread(cached_metadata, inspect_database_object, object_name, object_type, schema)
 
 
 @mcp.tool()
+@handle_tool_errors("explain_query")
 async def explain_query(query: str,
                        analyze: bool = False,
                        format: str = 'json') -> Dict[str, Any]:
@@ -445,25 +447,17 @@ async def explain_query(query: str,
         - Join methods and order
         - Actual vs estimated rows (if analyze=True)
     """
-    try:
-        if not db_service:
-            initialize_database()
-        return analyze_query_plan(db_service, query, analyze, format)
-    except MCPError as e:
-        logger.error(f"MCP error in explain_query: {e}")
-        return {
-            'error': str(e),
-            'recoverable': e.recoverable
-        }
-    except Exception as e:
-        logger.error(f"Unexpected error in explain_query: {e}")
-        return {
-            'error': f"Unexpected error: {str(e)}",
-            'recoverable': False
-        }
+    if analyze:
+        # Actual timings differ run to run, so ANALYZE plans are never reused
+        return await run_in_db_thread(analyze_query_plan, db_service, query, analyze, format)
+    # Estimated plans are reused for the same query, however it is spaced
+    return await run_in_db_thread(functools.partial(
+        cached_metadata, analyze_query_plan, query, analyze, format,
+        key=(normalize_sql(query), format)))
 
 
 @mcp.tool()
+@handle_tool_errors("list_views")
 async def list_views(schema: Optional[str] = None,
                     include_system: bool = False) -> Dict[str, Any]:
     """List all views in the database.
@@ -478,25 +472,11 @@ async def list_views(schema: Optional[str] = None,
         - count: Number of views
         - by_schema: Views grouped by schema
     """
-    try:
-        if not db_service:
-            initialize_database()
-        return enumerate_views(db_service, schema, include_system)
-    except MCPError as e:
-        logger.error(f"MCP error in list_views: {e}")
-        return {
-            'error': str(e),
-            'recoverable': e.recoverable
-        }
-    except Exception as e:
-        logger.error(f"Unexpected error in list_views: {e}")
-        return {
-            'error': f"Unexpected error: {str(e)}",
-            'recoverable': False
-        }
+    return await run_in_db_thread(cached_metadata, enumerate_views, schema, include_system)
 
 
 @mcp.tool()
+@handle_tool_errors("list_functions")
 async def list_functions(schema: Optional[str] = None,
                         include_system: bool = False) -> Dict[str, Any]:
     """List all functions and stored procedures.
@@ -511,25 +491,11 @@ async def list_functions(schema: Optional[str] = None,
         - count: Number of functions
         - by_language: Functions grouped by implementation language
     """
-    try:
-        if not db_service:
-            initialize_database()
-        return enumerate_functions(db_service, schema, include_system)
-    except MCPError as e:
-        logger.error(f"MCP error in list_functions: {e}")
-        return {
-            'error': str(e),
-            'recoverable': e.recoverable
-        }
-    except Exception as e:
-        logger.error(f"Unexpected error in list_functions: {e}")
-        return {
-            'error': f"Unexpected error: {str(e)}",
-            'recoverable': False
-        }
+    return await run_in_db_thread(cached_metadata, enumerate_functions, schema, include_system)
 
 
 @mcp.tool()
+@handle_tool_errors("list_indexes")
 async def list_indexes(table_name: Optional[str] = None,
                       schema: str = 'public',
                       include_unused: bool = True) -> Dict[str, Any]:
@@ -547,25 +513,11 @@ async def list_indexes(table_name: Optional[str] = None,
         - by_table: Indexes grouped by table
         - usage_stats: Index scan statistics
     """
-    try:
-        if not db_service:
-            initialize_database()
-        return enumerate_indexes(db_service, table_name, schema, include_unused)
-    except MCPError as e:
-        logger.error(f"MCP error in list_indexes: {e}")
-        return {
-            'error': str(e),
-            'recoverable': e.recoverable
-        }
-    except Exception as e:
-        logger.error(f"Unexpected error in list_indexes: {e}")
-        return {
-            'error': f"Unexpected error: {str(e)}",
-            'recoverable': False
-        }
+    return await run_in_db_thread(cached_metadata, enumerate_indexes, table_name, schema, include_unused)
 
 
 @mcp.tool()
+@handle_tool_errors("get_table_constraints")
 async def get_table_constraints(table_name: str,
                                schema: str = 'public') -> Dict[str, Any]:
     """Get all constraints for a table.
@@ -580,32 +532,11 @@ async def get_table_constraints(table_name: str,
         - by_type: Constraints grouped by type
         - foreign_key_graph: Relationships to other tables
     """
-    try:
-        if not db_service:
-            initialize_database()
-        return fetch_table_constraints(db_service, table_name, schema)
-    except InvalidTableError as e:
-        logger.error(f"Invalid table error in get_table_constraints: {e}")
-        return {
-            'error': str(e),
-            'table_name': e.table_name,
-            'recoverable': e.recoverable
-        }
-    except MCPError as e:
-        logger.error(f"MCP error in get_table_constraints: {e}")
-        return {
-            'error': str(e),
-            'recoverable': e.recoverable
-        }
-    except Exception as e:
-        logger.error(f"Unexpected error in get_table_constraints: {e}")
-        return {
-            'error': f"Unexpected error: {str(e)}",
-            'recoverable': False
-        }
+    return await run_in_db_thread(cached_metadata, fetch_table_constraints, table_name, schema)
 
 
 @mcp.tool()
+@handle_tool_errors("get_dependencies")
 async def get_dependencies(object_name: str,
                           object_type: str,
                           schema: str = 'public',
@@ -624,22 +555,7 @@ async def get_dependencies(object_name: str,
         - referenced_by: Objects that depend on this object
         - dependency_graph: Visual representation of dependencies
     """
-    try:
-        if not db_service:
-            initialize_database()
-        return analyze_object_dependencies(db_service, object_name, schema, direction)
-    except MCPError as e:
-        logger.error(f"MCP error in get_dependencies: {e}")
-        return {
-            'error': str(e),
-            'recoverable': e.recoverable
-        }
-    except Exception as e:
-        logger.error(f"Unexpected error in get_dependencies: {e}")
-        return {
-            'error': f"Unexpected error: {str(e)}",
-            'recoverable': False
-        }
+    return await run_in_db_thread(cached_metadata, analyze_object_dependencies, object_name, schema, direction)
 
 @mcp.tool(name="safe_read_query")
 async def execute_sql_query(query: str, limit: Optional[int] = None) -> Dict[str, Any]:
@@ -681,40 +597,127 @@ async def execute_sql_query(query: str, limit: Optional[int] = None) -> Dict[str
         }
 
     try:
-        # Extract table names from the query
-        table_names = extract_table_names_from_query(query)
-        logger.debug(f"Query references tables: {sorted(table_names)}")
-
-        # Check session state for prerequisite validation
-        session = get_session_state()
-        validation_error = session.validate_query_prerequisites(table_names)
-
-        if validation_error:
-            logger.warning(f"Query validation failed for tables: {sorted(table_names)}")
-            return validation_error
+        # Queries made up only of plan-only EXPLAINs return no table data,
+        # so they skip the inspected-table prerequisites
+        if is_plain_explain(query):
+            table_names = frozenset()
+        else:
+            # Extract table names from the query
+            table_names = extract_table_names_from_query(query)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Query references tables: %s", sorted(table_names))
+
+        # Catalog-only queries reference no user tables and need no checks
+        if table_names:
+            validation_error = session_state.validate_query_prerequisites(table_names)
+
+            if validation_error:
+                if logger.isEnabledFor(logging.WARNING):
+                    logger.warning("Query validation failed for tables: %s", sorted(table_names))
+                return validation_error
 
         # Execute the query
-        result = execute_query(db_service, query, limit)
-        logger.info(f"Successfully executed query on {len(table_names)} table(s), "
-                   f"returned {result.get('row_count', 0)} rows")
+        result = await run_in_db_thread(execute_query, db_service, query, limit)
+        logger.info("Successfully executed query on %d table(s), returned %d rows",
+                    len(table_names), result.get('row_count', 0))
         return result
 
     except MCPError as e:
-        logger.error(f"MCP error executing query: {e.message}")
+        logger.error("MCP error executing query: %s", e.message)
         return {
             'error': e.message,
             'recoverable': e.recoverable,
             'suggestion': 'Check your SQL syntax and table names'
         }
     except Exception as e:
-        logger.error(f"Unexpected error executing query: {str(e)}")
+        logger.error("Unexpected error executing query: %s", e)
         return {
             'error': f"Unexpected error: {str(e)}",
             'recoverable': False,
             'suggestion': 'Verify table names with discover_tables and inspect_table_schema'
         }
 
-def run_health_api(health_api: HealthAPI):
+
+# Tools batch_execute can dispatch to, by their MCP names
+_BATCH_TOOLS: Dict[str, Callable[..., Any]] = {
+    'discover_tables': list_tables,
+    'inspect_table_schema': describe_table,
+    'table_statistics': table_statistics,
+    'schemas_list': schemas_list,
+    'database_stats': database_stats,
+    'connection_info': connection_info,
+    'column_statistics': column_statistics,
+    'describe_object': describe_object,
+    'explain_query': explain_query,
+    'list_views': list_views,
+    'list_functions': list_functions,
+    'list_indexes': list_indexes,
+    'get_table_constraints': get_table_constraints,
+    'get_dependencies': get_dependencies,
+    'safe_read_query': execute_sql_query,
+}
+
+
+@mcp.tool()
+@handle_tool_errors("batch_execute")
+async def batch_execute(calls: List[Dict[str, Any]],
+                        max_concurrent: int = 8,
+                        stop_on_error: bool = False) -> Dict[str, Any]:
+    """Run several tool calls in one request, concurrently.
+
+    Use this to gather independent information in a single round trip,
+    e.g. discover_tables, database_stats and connection_info together.
+    Calls run in parallel, so one call cannot rely on another's side effects
+    (such as inspect_table_schema before safe_read_query in the same batch).
+
+    Args:
+        calls: List of {"tool": <tool name>, "args": {<tool arguments>}}
+        max_concurrent: Maximum number of calls running at once (default: 8)
+        stop_on_error: Skip calls not yet started once any call fails
+
+    Returns:
+        Dictionary containing:
+        - results: One {"tool", "result"} entry per call, in request order
+        - count: Number of calls
+        - error_count: Number of calls that returned an error
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrent))
+    failed = asyncio.Event()
+
+    async def run_call(call: Dict[str, Any]) -> Dict[str, Any]:
+        if not isinstance(call, dict):
+            call = {}
+        tool_name = call.get('tool')
+        tool = _BATCH_TOOLS.get(tool_name)
+        args = call.get('args') or {}
+        if tool is None:
+            result = {'error': f"Unknown tool: {tool_name}", 'recoverable': False}
+        elif not isinstance(args, dict):
+            result = {'error': "Tool args must be an object", 'recoverable': False}
+        else:
+            async with semaphore:
+                if stop_on_error and failed.is_set():
+                    return {'tool': tool_name,
+                            'result': {'error': "Skipped after an earlier call failed",
+                                       'recoverable': True}}
+                # Tools turn their own exceptions into error responses
+                result = await tool(**args)
+        if isinstance(result, dict) and 'error' in result:
+            failed.set()
+        return {'tool': tool_name, 'result': result}
+
+    results = await asyncio.gather(*(run_call(call) for call in calls))
+    error_count = sum(1 for r in results
+                      if isinstance(r['result'], dict) and 'error' in r['result'])
+    logger.info("Batch executed %d call(s), %d error(s)", len(results), error_count)
+    return {
+        'results': results,
+        'count': len(results),
+        'error_count': error_count
+    }
+
+
+def run_health_api(health_api: 'HealthAPI'):
     """Run health API in a separate thread.
     
     Args:
@@ -738,11 +741,10 @@ def shutdown_handler(signum, frame):
     # Set shutdown flag
     global shutdown_requested
     shutdown_requested = True
-    
-    # Clean up resources
-    cleanup_resources()
-    
-    sys.exit(0)
+
+    # Unwind to main() and let its finally block clean up; closing the pool
+    # here could block on a connection a worker thread is still reading
+    raise KeyboardInterrupt
 
 
 def cleanup_resources():
@@ -751,6 +753,10 @@ def cleanup_resources():
     
     logger.info("Cleaning up resources...")
     
+    # Stop handing out database work before the pool goes away
+    if db_executor:
+        db_executor.shutdown(wait=False, cancel_futures=True)
+
     # Close database connections
     if db_service:
         try:
@@ -767,6 +773,21 @@ def cleanup_resources():
 shutdown_requested = False
 
 
+def use_uvloop_if_available():
+    """Run the MCP transports on uvloop's event loop when it is installed.
+
+    FastMCP starts its loop through anyio, which honours the asyncio event
+    loop policy, so installing uvloop's policy is enough to switch both
+    transports. uvloop is optional; without it the default loop is used.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Using uvloop event loop")
+
+
 def main():
     """Main entry point for the MCP server."""
     # Set up signal handlers for graceful shutdown
@@ -807,20 +828,19 @@ def main():
     args = parser.parse_args()
     
     try:
-        # Initialize database on startup
-        initialize_database()
-        
-        # Start health API in background thread if enabled
+        # Start health API in background thread if enabled. It serves
+        # liveness while the database connects and reports ready once the
+        # database is attached below
         health_api = None
         health_thread = None
         
         if not args.no_health_api:
             logger.info(f"Starting Health API on port {args.health_port}")
+            from src.services.health_api import HealthAPI
             health_api = HealthAPI(
-                db_service=db_service,
-                db_config=db_config,
                 host=args.host,
-                port=args.health_port
+                port=args.health_port,
+                max_db_connections=HEALTH_API_RESERVED_CONNECTIONS
             )
             health_thread = threading.Thread(
                 target=run_health_api,
@@ -828,7 +848,15 @@ def main():
                 daemon=True
             )
             health_thread.start()
+
+        # Initialize database on startup, before any transport accepts tool
+        # calls; the tools use db_service without re-checking it
+        initialize_database()
+        if health_api:
+            health_api.attach_database(db_service, db_config)
         
+        use_uvloop_if_available()
+
         # Select and run transport
         if args.transport == "stdio":
             logger.info("Starting PostgreSQL MCP Server in stdio mode...")
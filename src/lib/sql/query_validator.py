@@ -8,6 +8,40 @@ import re
 from typing import Tuple
 from src.models.error_types import InvalidQueryError
 
+# Comment patterns
+_LINE_COMMENT_RE = re.compile(r'--.*$', re.MULTILINE)
+_BLOCK_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+
+# Allowed statement prefixes
+_ALLOWED_PREFIXES = ('SELECT', 'WITH', 'EXPLAIN', 'ANALYZE')
+
+# Dangerous keywords that indicate write operations, with word boundaries to
+# avoid false positives (e.g. "SELECT description" shouldn't match "UPDATE")
+_DANGEROUS_KEYWORD_PATTERNS = tuple(
+    (keyword, re.compile(r'\b' + keyword + r'\b'))
+    for keyword in (
+        'INSERT', 'UPDATE', 'DELETE', 'DROP', 'CREATE', 'ALTER',
+        'TRUNCATE', 'GRANT', 'REVOKE', 'COMMIT', 'ROLLBACK',
+        'SET', 'RESET', 'COPY', 'IMPORT', 'CALL', 'EXECUTE'
+    )
+)
+
+# Dangerous functions that could modify data or system state
+_DANGEROUS_FUNCTION_PATTERNS = tuple(
+    (func, re.compile(r'\b' + func + r'\s*\('))
+    for func in (
+        'DBLINK_EXEC', 'DBLINK_CONNECT', 'DBLINK_DISCONNECT',
+        'PG_RELOAD_CONF', 'PG_ROTATE_LOGFILE', 'PG_CANCEL_BACKEND',
+        'PG_TERMINATE_BACKEND', 'PG_FILE_WRITE', 'PG_FILE_UNLINK',
+        'PG_FILE_RENAME', 'COPY_FILE', 'PG_READ_FILE',
+        'LO_IMPORT', 'LO_EXPORT', 'LO_UNLINK'
+    )
+)
+
+_LIMIT_RE = re.compile(r'\bLIMIT\s+\d+')
+_FROM_TABLE_RE = re.compile(r'\bFROM\s+([^\s,\(]+)')
+_JOIN_TABLE_RE = re.compile(r'\bJOIN\s+([^\s,\(]+)')
+
 
 def validate_select_only(query: str) -> bool:
     """Validate that a query is SELECT-only (no DML/DDL operations).
@@ -46,10 +80,10 @@ def validate_select_only(query: str) -> bool:
 def _remove_comments(query: str) -> str:
     """Remove SQL comments from query."""
     # Remove -- comments (to end of line)
-    query = re.sub(r'--.*$', '', query, flags=re.MULTILINE)
+    query = _LINE_COMMENT_RE.sub('', query)
 
     # Remove /* */ comments
-    query = re.sub(r'/\*.*?\*/', '', query, flags=re.DOTALL)
+    query = _BLOCK_COMMENT_RE.sub('', query)
 
     return query
 
@@ -64,30 +98,16 @@ def _validate_single_statement(stmt: str, original_query: str) -> None:
     Raises:
         InvalidQueryError: If statement is not safe
     """
-    # List of dangerous keywords that indicate write operations
-    dangerous_keywords = [
-        'INSERT', 'UPDATE', 'DELETE', 'DROP', 'CREATE', 'ALTER',
-        'TRUNCATE', 'GRANT', 'REVOKE', 'COMMIT', 'ROLLBACK',
-        'SET', 'RESET', 'COPY', 'IMPORT', 'CALL', 'EXECUTE'
-    ]
-
-    # List of allowed statement prefixes
-    allowed_prefixes = ['SELECT', 'WITH', 'EXPLAIN', 'ANALYZE']
-
     # Check if statement starts with an allowed keyword
-    starts_with_allowed = any(stmt.startswith(prefix) for prefix in allowed_prefixes)
-
-    if not starts_with_allowed:
+    if not stmt.startswith(_ALLOWED_PREFIXES):
         raise InvalidQueryError(
             original_query,
-            f"Statement must start with one of: {', '.join(allowed_prefixes)}"
+            f"Statement must start with one of: {', '.join(_ALLOWED_PREFIXES)}"
         )
 
     # Check for dangerous keywords anywhere in the statement
-    # Use word boundaries to avoid false positives (e.g. "SELECT description" shouldn't match "UPDATE")
-    for keyword in dangerous_keywords:
-        pattern = r'\b' + keyword + r'\b'
-        if re.search(pattern, stmt):
+    for keyword, pattern in _DANGEROUS_KEYWORD_PATTERNS:
+        if pattern.search(stmt):
             raise InvalidQueryError(
                 original_query,
                 f"Query contains forbidden operation: {keyword}"
@@ -107,18 +127,8 @@ def _check_for_functions(stmt: str, original_query: str) -> None:
     Raises:
         InvalidQueryError: If dangerous functions are found
     """
-    # List of dangerous functions that could modify data or system state
-    dangerous_functions = [
-        'DBLINK_EXEC', 'DBLINK_CONNECT', 'DBLINK_DISCONNECT',
-        'PG_RELOAD_CONF', 'PG_ROTATE_LOGFILE', 'PG_CANCEL_BACKEND',
-        'PG_TERMINATE_BACKEND', 'PG_FILE_WRITE', 'PG_FILE_UNLINK',
-        'PG_FILE_RENAME', 'COPY_FILE', 'PG_READ_FILE',
-        'LO_IMPORT', 'LO_EXPORT', 'LO_UNLINK'
-    ]
-
-    for func in dangerous_functions:
-        pattern = r'\b' + func + r'\s*\('
-        if re.search(pattern, stmt):
+    for func, pattern in _DANGEROUS_FUNCTION_PATTERNS:
+        if pattern.search(stmt):
             raise InvalidQueryError(
                 original_query,
                 f"Query contains forbidden function: {func}"
@@ -141,7 +151,7 @@ def add_limit_if_missing(query: str, default_limit: int = 100) -> str:
     normalized = query.strip().upper()
 
     # Check if LIMIT already exists
-    if re.search(r'\bLIMIT\s+\d+', normalized):
+    if _LIMIT_RE.search(normalized):
         return query
 
     # Check if it's an EXPLAIN query (don't add LIMIT to EXPLAIN)
@@ -170,11 +180,11 @@ def extract_table_references(query: str) -> list:
     tables = []
 
     # Find table names after FROM
-    from_matches = re.findall(r'\bFROM\s+([^\s,\(]+)', normalized)
+    from_matches = _FROM_TABLE_RE.findall(normalized)
     tables.extend(from_matches)
 
     # Find table names after JOIN
-    join_matches = re.findall(r'\bJOIN\s+([^\s,\(]+)', normalized)
+    join_matches = _JOIN_TABLE_RE.findall(normalized)
     tables.extend(join_matches)
 
     # Remove schema qualifiers and clean up
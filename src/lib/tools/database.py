@@ -60,7 +60,7 @@ def get_database_stats(db_service: DatabaseService) -> Dict[str, Any]:
         WHERE s.datname = current_database()
     """
 
-    results = db_service.execute_readonly_query(query)
+    results = db_service.execute_readonly_query(query, prepare='mcp_database_stats')
 
     if not results:
         raise MCPError("Failed to retrieve database statistics", recoverable=True)
@@ -132,8 +132,35 @@ def get_connection_info(db_service: DatabaseService,
         WHERE pid != pg_backend_pid()
     """
 
-    # Execute base query
-    results = db_service.execute_readonly_query(base_query)
+    if by_database:
+        # Per-database counts come back in the same round trip: one row per
+        # database, each carrying the overall totals as window sums. Joining
+        # from a one-row source keeps a (zero-count) row when nothing else
+        # is connected
+        query = """
+            SELECT
+                (SELECT setting FROM pg_settings WHERE name = 'max_connections')::int as max_connections,
+                (SUM(COUNT(a.pid)) OVER ())::bigint as current_connections,
+                (SUM(SUM(CASE WHEN a.state = 'idle' THEN 1 ELSE 0 END)) OVER ())::bigint as idle_connections,
+                (SUM(SUM(CASE WHEN a.state = 'active' THEN 1 ELSE 0 END)) OVER ())::bigint as active_queries,
+                (SUM(SUM(CASE WHEN a.state = 'idle in transaction' THEN 1 ELSE 0 END)) OVER ())::bigint as idle_in_transaction,
+                (SUM(SUM(CASE WHEN a.state = 'idle in transaction (aborted)' THEN 1 ELSE 0 END)) OVER ())::bigint as idle_in_transaction_aborted,
+                (SUM(SUM(CASE WHEN a.state = 'fastpath function call' THEN 1 ELSE 0 END)) OVER ())::bigint as fastpath_function_call,
+                (SUM(SUM(CASE WHEN a.pid IS NOT NULL AND a.state IS NULL THEN 1 ELSE 0 END)) OVER ())::bigint as disabled,
+                a.datname as database,
+                COUNT(a.pid) as count
+            FROM (SELECT 1) one
+            LEFT JOIN pg_stat_activity a ON a.pid != pg_backend_pid()
+            GROUP BY a.datname
+            ORDER BY count DESC
+        """
+    else:
+        query = base_query
+
+    results = db_service.execute_readonly_query(
+        query,
+        prepare='mcp_connections_by_database' if by_database else 'mcp_connection_info'
+    )
 
     if not results:
         raise MCPError("Failed to retrieve connection information", recoverable=True)
@@ -159,22 +186,14 @@ def get_connection_info(db_service: DatabaseService,
             disabled=conn_info['disabled']
         )
 
-    # Get connections by database if requested
+    # Connections by database, already fetched with the totals above. With
+    # no other connections the only row is the placeholder from the join
     connections_by_database = None
     if by_database:
-        db_query = """
-            SELECT datname as database, COUNT(*) as count
-            FROM pg_stat_activity
-            WHERE pid != pg_backend_pid()
-            GROUP BY datname
-            ORDER BY count DESC
-        """
-        db_results = db_service.execute_readonly_query(db_query)
-
         connections_by_database = [
             ConnectionByDatabase(database=row['database'], count=row['count'])
-            for row in db_results
-        ]
+            for row in results
+        ] if conn_info['current_connections'] else []
 
     # Add warnings for connection saturation
     warnings = []
@@ -50,10 +50,11 @@ def inspect_database_object(db_service: DatabaseService,
                 AND s.sequence_schema = params.obj_schema
         """
 
-        results = db_service.execute_readonly_query(detect_query, (object_name, schema))
+        results = db_service.execute_readonly_query(detect_query, (object_name, schema),
+                                                    prepare='mcp_detect_object_type')
         if results and results[0]['object_type'] != 'unknown':
             object_type = results[0]['object_type']
-            logger.debug(f"Auto-detected object type: {object_type}")
+            logger.debug("Auto-detected object type: %s", object_type)
         else:
             raise MCPError(f"Object '{schema}.{object_name}' not found")
 
@@ -72,7 +73,18 @@ def inspect_database_object(db_service: DatabaseService,
                 c.relhassubclass as has_partitions,
                 c.relpersistence = 't' as is_temporary,
                 s.last_vacuum::text,
-                s.last_analyze::text
+                s.last_analyze::text,
+                -- Columns ride along in the same round trip
+                COALESCE((
+                    SELECT json_agg(json_build_object(
+                        'column_name', col.column_name,
+                        'data_type', col.data_type,
+                        'is_nullable', col.is_nullable,
+                        'column_default', col.column_default
+                    ) ORDER BY col.ordinal_position)
+                    FROM information_schema.columns col
+                    WHERE col.table_name = t.tablename AND col.table_schema = t.schemaname
+                ), '[]'::json) as columns
             FROM pg_tables t
             JOIN pg_class c ON c.relname = t.tablename
             JOIN pg_namespace n ON n.oid = c.relnamespace AND n.nspname = t.schemaname
@@ -148,31 +160,22 @@ def inspect_database_object(db_service: DatabaseService,
     else:
         raise MCPError(f"Unsupported object type: {object_type}")
 
-    results = db_service.execute_readonly_query(query, (object_name, schema))
+    results = db_service.execute_readonly_query(query, (object_name, schema),
+                                                prepare=f'mcp_describe_{object_type}')
 
     if not results:
         raise MCPError(f"Object '{schema}.{object_name}' not found")
 
-    result = dict(results[0])
+    # Rows are already plain dicts owned by this call, so add to it in place
+    result = results[0]
 
     # Add metadata
     result['object_type'] = object_type
     result['object_name'] = object_name
     result['schema_name'] = schema
 
-    # For tables, add column information
-    if object_type == 'table':
-        column_query = """
-            SELECT column_name, data_type, is_nullable, column_default
-            FROM information_schema.columns
-            WHERE table_name = %s AND table_schema = %s
-            ORDER BY ordinal_position
-        """
-        column_results = db_service.execute_readonly_query(column_query, (object_name, schema))
-        result['columns'] = [dict(row) for row in column_results]
-    else:
-        # Ensure columns field exists for other object types
-        result['columns'] = []
+    # Tables get their columns from the main query; other types have none
+    result.setdefault('columns', [])
 
     # Clean up None values
     return {k: v for k, v in result.items() if v is not None}
@@ -561,57 +564,57 @@ def fetch_table_constraints(db_service: DatabaseService,
     logger.info(f"Getting constraints for table: {schema}.{table_name}")
 
     query = """
-        WITH constraints AS (
-            SELECT
-                tc.constraint_name,
-                tc.constraint_type,
-                tc.table_name,
-                kcu.column_name,
-                pg_get_constraintdef(con.oid, true) as definition,
-                ccu.table_name AS foreign_table,
-                ccu.column_name AS foreign_column,
-                rc.update_rule,
-                rc.delete_rule
-            FROM information_schema.table_constraints tc
-            JOIN pg_constraint con ON con.conname = tc.constraint_name
-                AND con.connamespace = (SELECT oid FROM pg_namespace WHERE nspname = tc.table_schema)
-            LEFT JOIN information_schema.key_column_usage kcu
-                ON tc.constraint_name = kcu.constraint_name
-                AND tc.table_schema = kcu.table_schema
-                AND tc.table_name = kcu.table_name
-            LEFT JOIN information_schema.constraint_column_usage ccu
-                ON ccu.constraint_name = tc.constraint_name
-                AND ccu.table_schema = tc.table_schema
-                AND tc.constraint_type = 'FOREIGN KEY'
-            LEFT JOIN information_schema.referential_constraints rc
-                ON rc.constraint_name = tc.constraint_name
-                AND rc.constraint_schema = tc.table_schema
-            WHERE tc.table_schema = %s
-            AND tc.table_name = %s
-        )
         SELECT
-            constraint_name,
-            constraint_type,
-            table_name,
-            column_name as columns,
-            definition,
-            foreign_table,
-            foreign_column,
-            update_rule,
-            delete_rule
-        FROM constraints
+            con.conname AS constraint_name,
+            CASE con.contype
+                WHEN 'p' THEN 'PRIMARY KEY'
+                WHEN 'u' THEN 'UNIQUE'
+                WHEN 'f' THEN 'FOREIGN KEY'
+                WHEN 'c' THEN 'CHECK'
+            END AS constraint_type,
+            rel.relname AS table_name,
+            a.attname AS columns,
+            pg_get_constraintdef(con.oid, true) as definition,
+            frel.relname AS foreign_table,
+            fa.attname AS foreign_column,
+            CASE con.confupdtype
+                WHEN 'a' THEN 'NO ACTION'
+                WHEN 'r' THEN 'RESTRICT'
+                WHEN 'c' THEN 'CASCADE'
+                WHEN 'n' THEN 'SET NULL'
+                WHEN 'd' THEN 'SET DEFAULT'
+            END AS update_rule,
+            CASE con.confdeltype
+                WHEN 'a' THEN 'NO ACTION'
+                WHEN 'r' THEN 'RESTRICT'
+                WHEN 'c' THEN 'CASCADE'
+                WHEN 'n' THEN 'SET NULL'
+                WHEN 'd' THEN 'SET DEFAULT'
+            END AS delete_rule
+        FROM pg_constraint con
+        JOIN pg_class rel ON rel.oid = con.conrelid
+        JOIN pg_namespace ns ON ns.oid = rel.relnamespace
+        LEFT JOIN pg_attribute a
+            ON a.attrelid = con.conrelid AND a.attnum = con.conkey[1]
+        LEFT JOIN pg_class frel ON frel.oid = con.confrelid
+        LEFT JOIN pg_attribute fa
+            ON fa.attrelid = con.confrelid AND fa.attnum = con.confkey[1]
+        WHERE ns.nspname = %s
+        AND rel.relname = %s
+        AND con.contype IN ('p', 'u', 'f', 'c')
         ORDER BY
-            CASE constraint_type
-                WHEN 'PRIMARY KEY' THEN 1
-                WHEN 'UNIQUE' THEN 2
-                WHEN 'FOREIGN KEY' THEN 3
-                WHEN 'CHECK' THEN 4
+            CASE con.contype
+                WHEN 'p' THEN 1
+                WHEN 'u' THEN 2
+                WHEN 'f' THEN 3
+                WHEN 'c' THEN 4
                 ELSE 5
             END,
-            constraint_name
+            con.conname
     """
 
-    results = db_service.execute_readonly_query(query, (schema, table_name))
+    results = db_service.execute_readonly_query(query, (schema, table_name),
+                                                prepare='mcp_table_constraints')
 
     constraints = []
     seen_constraints = set()
@@ -759,7 +762,8 @@ def analyze_object_dependencies(db_service: DatabaseService,
     }
 
     if direction in ['depends_on', 'both']:
-        depends_on_results = db_service.execute_readonly_query(depends_on_query, (object_name, schema))
+        depends_on_results = db_service.execute_readonly_query(depends_on_query, (object_name, schema),
+                                                               prepare='mcp_depends_on')
 
         dependencies = []
         for row in depends_on_results:
@@ -778,7 +782,8 @@ def analyze_object_dependencies(db_service: DatabaseService,
             response['depends_on'] = dependencies
 
     if direction in ['dependents', 'both']:
-        dependents_results = db_service.execute_readonly_query(dependents_query, (object_name, schema))
+        dependents_results = db_service.execute_readonly_query(dependents_query, (object_name, schema),
+                                                               prepare='mcp_dependents')
 
         dependents = []
         for row in dependents_results:
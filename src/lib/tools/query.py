@@ -4,10 +4,13 @@ This module provides safe query execution capabilities following the
 postgres-mcp best practices - simple, flexible, and secure.
 """
 
+import functools
+import logging
 import time
-from typing import Dict, Any, Optional, List, Set
+from typing import Dict, Any, FrozenSet, Optional, List, Set
 import pglast
-from pglast import ast, stream
+from pglast import ast
+from pglast.visitors import Visitor
 
 from src.lib.logging_config import get_logger
 from src.models.error_types import MCPError, InvalidQueryError
@@ -15,6 +18,31 @@ from src.services.database_service import DatabaseService
 
 logger = get_logger(__name__)
 
+# System/information schema tables that don't need inspection
+_SYSTEM_TABLES = frozenset({
+    'information_schema.tables', 'information_schema.columns',
+    'information_schema.schemata', 'pg_tables', 'pg_catalog.pg_tables',
+    'pg_stat_activity', 'pg_database', 'pg_user', 'pg_settings',
+    # Additional specific table names that might be extracted from system queries
+    'tables', 'columns', 'schemata'
+})
+
+# Only these statement types are allowed
+_SAFE_STATEMENTS = (
+    ast.SelectStmt,    # SELECT queries
+    ast.ExplainStmt,   # EXPLAIN queries
+    ast.VariableSetStmt,  # SET statements (for query parameters)
+)
+
+# Functions that could modify data or system state
+_DANGEROUS_FUNCTIONS = frozenset({
+    'dblink_exec', 'dblink_connect', 'dblink_disconnect',
+    'pg_reload_conf', 'pg_rotate_logfile', 'pg_cancel_backend',
+    'pg_terminate_backend', 'pg_file_write', 'pg_file_unlink',
+    'pg_file_rename', 'copy_file', 'pg_read_file',
+    'lo_import', 'lo_export', 'lo_unlink'
+})
+
 
 def validate_safe_sql(query: str) -> None:
     """Validate SQL query for safety using proper SQL parsing.
@@ -43,9 +71,13 @@ def validate_safe_sql(query: str) -> None:
         raise InvalidQueryError(query, f"SQL parsing error: {str(e)}")
 
 
-def extract_table_names_from_query(query: str) -> Set[str]:
+@functools.lru_cache(maxsize=1024)
+def extract_table_names_from_query(query: str) -> FrozenSet[str]:
     """Extract table names from SQL query using pglast parser.
 
+    Results are memoized per query string, since agents often resend the
+    same SQL; they are frozen so callers cannot alter a cached result.
+
     Args:
         query: SQL query string
 
@@ -56,7 +88,7 @@ def extract_table_names_from_query(query: str) -> Set[str]:
         InvalidQueryError: If query cannot be parsed
     """
     if not query or not query.strip():
-        return set()
+        return frozenset()
 
     try:
         # Parse SQL using pglast
@@ -67,25 +99,79 @@ def extract_table_names_from_query(query: str) -> Set[str]:
         for statement in parsed:
             _extract_tables_from_node(statement, table_names)
 
-        # Filter out system/information schema tables that don't need inspection
-        system_tables = {
-            'information_schema.tables', 'information_schema.columns',
-            'information_schema.schemata', 'pg_tables', 'pg_catalog.pg_tables',
-            'pg_stat_activity', 'pg_database', 'pg_user', 'pg_settings',
-            # Additional specific table names that might be extracted from system queries
-            'tables', 'columns', 'schemata'
-        }
-
         # Remove system tables from validation requirements
-        filtered_tables = {t for t in table_names if t not in system_tables and not t.startswith('pg_') and not t.startswith('information_schema.')}
+        filtered_tables = frozenset(t for t in table_names if t not in _SYSTEM_TABLES and not t.startswith(('pg_', 'information_schema.')))
 
-        logger.debug(f"Extracted table names from query (filtered): {sorted(filtered_tables)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Extracted table names from query (filtered): %s", sorted(filtered_tables))
         return filtered_tables
 
     except pglast.Error as e:
         raise InvalidQueryError(query, f"SQL parsing error during table extraction: {str(e)}")
 
 
+_COMMENT_TOKENS = frozenset({'SQL_COMMENT', 'C_COMMENT'})
+
+
+def normalize_sql(query: str) -> str:
+    """Canonicalize SQL text so trivially different spellings compare equal.
+
+    Comments and trailing semicolons are dropped, tokens are separated by a
+    single space and keywords are upper-cased. Literals and quoted
+    identifiers are left exactly as written. Text the scanner rejects is
+    returned stripped but otherwise unchanged.
+
+    Args:
+        query: SQL query string
+
+    Returns:
+        Normalized query string
+    """
+    try:
+        tokens = [t for t in pglast.parser.scan(query) if t.name not in _COMMENT_TOKENS]
+    except pglast.Error:
+        return query.strip()
+
+    while tokens and tokens[-1].name == 'ASCII_59':  # trailing ';'
+        tokens.pop()
+
+    parts = []
+    for token in tokens:
+        text = query[token.start:token.end + 1]
+        parts.append(text if token.kind == 'NO_KEYWORD' else text.upper())
+    return ' '.join(parts)
+
+
+def is_plain_explain(query: str) -> bool:
+    """Check whether a query only asks for a plan, without running it.
+
+    A plain EXPLAIN returns no table data, so it needs no inspected-table
+    prerequisites. Every statement in the query must be an EXPLAIN without
+    an ANALYZE option (which executes the statement); any ANALYZE option,
+    even ANALYZE false, is treated as executing, erring on the side of checks.
+
+    Args:
+        query: SQL query string
+
+    Returns:
+        True if every statement is an EXPLAIN that does not execute its query
+    """
+    try:
+        parsed = pglast.parse_sql(query)
+    except pglast.Error:
+        return False
+
+    if not parsed:
+        return False
+    for statement in parsed:
+        node = statement.stmt
+        if not isinstance(node, ast.ExplainStmt):
+            return False
+        if any(option.defname == 'analyze' for option in node.options or ()):
+            return False
+    return True
+
+
 def _extract_tables_from_node(node, table_names: Set[str]) -> None:
     """Recursively extract table names from AST node.
 
@@ -139,13 +225,7 @@ def _validate_statement_node(stmt_node, original_query: str) -> None:
     stmt = stmt_node.stmt
 
     # Allow only specific safe statement types
-    safe_statements = (
-        ast.SelectStmt,    # SELECT queries
-        ast.ExplainStmt,   # EXPLAIN queries
-        ast.VariableSetStmt,  # SET statements (for query parameters)
-    )
-
-    if not isinstance(stmt, safe_statements):
+    if not isinstance(stmt, _SAFE_STATEMENTS):
         statement_type = type(stmt).__name__
         raise InvalidQueryError(
             original_query,
@@ -162,6 +242,16 @@ def _validate_statement_node(stmt_node, original_query: str) -> None:
     _check_for_dangerous_functions(stmt, original_query)
 
 
+class _FunctionCallCollector(Visitor):
+    """Collect the (unqualified, lowercase) names of all called functions."""
+
+    def __init__(self):
+        self.function_names: Set[str] = set()
+
+    def visit_FuncCall(self, ancestors, node):
+        self.function_names.add(node.funcname[-1].sval.lower())
+
+
 def _check_for_dangerous_functions(stmt, original_query: str) -> None:
     """Check for potentially dangerous function calls in the AST.
 
@@ -172,28 +262,18 @@ def _check_for_dangerous_functions(stmt, original_query: str) -> None:
     Raises:
         InvalidQueryError: If dangerous functions are found
     """
-    dangerous_functions = {
-        'dblink_exec', 'dblink_connect', 'dblink_disconnect',
-        'pg_reload_conf', 'pg_rotate_logfile', 'pg_cancel_backend',
-        'pg_terminate_backend', 'pg_file_write', 'pg_file_unlink',
-        'pg_file_rename', 'copy_file', 'pg_read_file',
-        'lo_import', 'lo_export', 'lo_unlink'
-    }
-
-    # Convert AST back to SQL for function checking
-    # This is simpler than traversing the entire AST
-    try:
-        sql_text = stream.RawStream()(stmt).upper()
-
-        for func in dangerous_functions:
-            if func.upper() in sql_text:
-                raise InvalidQueryError(
-                    original_query,
-                    f"Query contains forbidden function: {func}"
-                )
-    except Exception:
-        # If we can't check functions, err on the side of caution
-        logger.warning("Could not check for dangerous functions in query")
+    # Walk the parsed tree once for function calls rather than rendering it
+    # back to SQL and substring-scanning; this also catches schema-qualified
+    # calls without flagging columns that merely contain a function name
+    collector = _FunctionCallCollector()
+    collector(stmt)
+
+    forbidden = collector.function_names & _DANGEROUS_FUNCTIONS
+    if forbidden:
+        raise InvalidQueryError(
+            original_query,
+            f"Query contains forbidden function: {', '.join(sorted(forbidden))}"
+        )
 
 
 def execute_query(db_service: DatabaseService,
@@ -29,8 +29,17 @@ def list_schemas(db_service: DatabaseService,
         - count: Number of schemas
         - database: Database name
     """
+    # Sizes are computed in the same query, one subquery per schema, rather
+    # than with a separate round trip for every schema listed
+    size_column = """,
+            (
+                SELECT SUM(pg_total_relation_size(c.oid))
+                FROM pg_catalog.pg_class c
+                WHERE c.relnamespace = n.oid
+            ) as total_size""" if include_sizes else ""
+
     # Base query for schema information
-    base_query = """
+    base_query = f"""
         SELECT
             n.nspname as schema_name,
             pg_catalog.pg_get_userbyid(n.nspowner) as schema_owner,
@@ -56,7 +65,7 @@ def list_schemas(db_service: DatabaseService,
                 SELECT COUNT(*)
                 FROM pg_catalog.pg_proc p
                 WHERE p.pronamespace = n.oid
-            ) as function_count
+            ) as function_count{size_column}
         FROM pg_catalog.pg_namespace n
         WHERE 1=1
     """
@@ -71,7 +80,12 @@ def list_schemas(db_service: DatabaseService,
     base_query += "\nORDER BY n.nspname"
 
     # Execute base query
-    results = db_service.execute_readonly_query(base_query)
+    statement = 'mcp_list_schemas'
+    if include_system:
+        statement += '_all'
+    if include_sizes:
+        statement += '_sizes'
+    results = db_service.execute_readonly_query(base_query, prepare=statement)
 
     if results is None:
         raise MCPError("Failed to retrieve schema list", recoverable=True)
@@ -91,22 +105,9 @@ def list_schemas(db_service: DatabaseService,
         size_bytes = None
         size_pretty = None
 
-        if include_sizes:
-            size_query = """
-                SELECT
-                    SUM(pg_total_relation_size(c.oid)) as total_size
-                FROM pg_catalog.pg_class c
-                JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
-                WHERE n.nspname = %s
-            """
-            size_results = db_service.execute_readonly_query(
-                size_query,
-                (row['schema_name'],)
-            )
-
-            if size_results and size_results[0]['total_size']:
-                size_bytes = size_results[0]['total_size']
-                size_pretty = _format_size(size_bytes)
+        if include_sizes and row.get('total_size'):
+            size_bytes = row['total_size']
+            size_pretty = _format_size(size_bytes)
 
         # Create SchemaInfo model
         schema_info = SchemaInfo(
@@ -13,20 +13,10 @@ from src.services.database_service import DatabaseService
 logger = get_logger(__name__)
 
 
-def _validate_identifier(identifier: str) -> None:
-    """Validate table/schema identifier for SQL injection attempts.
-
-    Args:
-        identifier: The identifier to validate
-
-    Raises:
-        InvalidTableError: If identifier contains invalid patterns
-    """
-    if not identifier:
-        raise InvalidTableError(identifier, "Identifier cannot be empty")
-
-    # Check for dangerous patterns that could indicate SQL injection
-    dangerous_patterns = [
+# Patterns that could indicate SQL injection in a table/schema identifier,
+# combined into one case-insensitive regex so each check is a single scan
+_DANGEROUS_IDENTIFIER_RE = re.compile(
+    '|'.join([
         r';',  # Statement separator
         r'--',  # SQL comment
         r'/\*',  # Multi-line comment start
@@ -39,15 +29,28 @@ def _validate_identifier(identifier: str) -> None:
         r'\bINSERT\b',  # INSERT statements
         r'\bUNION\b',  # UNION statements
         r'\bOR\b.*=.*=',  # OR 1=1 type injections
-    ]
+    ]),
+    re.IGNORECASE
+)
 
-    identifier_upper = identifier.upper()
-    for pattern in dangerous_patterns:
-        if re.search(pattern, identifier_upper, re.IGNORECASE):
-            raise InvalidTableError(
-                identifier,
-                f"Invalid identifier - not allowed pattern detected: {identifier}"
-            )
+
+def _validate_identifier(identifier: str) -> None:
+    """Validate table/schema identifier for SQL injection attempts.
+
+    Args:
+        identifier: The identifier to validate
+
+    Raises:
+        InvalidTableError: If identifier contains invalid patterns
+    """
+    if not identifier:
+        raise InvalidTableError(identifier, "Identifier cannot be empty")
+
+    if _DANGEROUS_IDENTIFIER_RE.search(identifier):
+        raise InvalidTableError(
+            identifier,
+            f"Invalid identifier - not allowed pattern detected: {identifier}"
+        )
 
 
 def get_tables(db_service: DatabaseService, schema: Optional[str] = None) -> Dict[str, Any]:
@@ -110,8 +113,11 @@ def get_tables(db_service: DatabaseService, schema: Optional[str] = None) -> Dic
 
     try:
         # Debug output
-        logger.debug(f"Executing query with params: {params}")
-        results = db_service.execute_readonly_query(query, params)
+        logger.debug("Executing query with params: %s", params)
+        results = db_service.execute_readonly_query(
+            query, params,
+            prepare='mcp_get_tables_in_schema' if schema else 'mcp_get_tables'
+        )
 
         if results is None:
             raise MCPError("Failed to retrieve table list", recoverable=True)
@@ -174,7 +180,16 @@ def get_columns(db_service: DatabaseService,
 
     # Enhanced query with foreign keys, comments, and constraints
     query = """
-        WITH column_info AS (
+        WITH target AS (
+            SELECT c.oid
+            FROM pg_catalog.pg_class c
+            JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = %s
+            AND c.relname = %s
+        ),
+        column_info AS (
+            -- information_schema keeps its portable type names here, which
+            -- callers rely on; everything else resolves via the table oid
             SELECT
                 c.column_name,
                 c.data_type,
@@ -184,70 +199,57 @@ def get_columns(db_service: DatabaseService,
                 c.numeric_precision,
                 c.numeric_scale,
                 c.ordinal_position,
-                col_description(pgc.oid, c.ordinal_position) as column_comment
+                col_description((SELECT oid FROM target), c.ordinal_position) as column_comment
             FROM information_schema.columns c
-            JOIN pg_catalog.pg_class pgc ON pgc.relname = c.table_name
-            JOIN pg_catalog.pg_namespace pgn ON pgn.oid = pgc.relnamespace
-                AND pgn.nspname = c.table_schema
             WHERE c.table_schema = %s
             AND c.table_name = %s
         ),
         foreign_keys AS (
             SELECT
-                kcu.column_name,
-                ccu.table_schema AS foreign_table_schema,
-                ccu.table_name AS foreign_table,
-                ccu.column_name AS foreign_column,
-                rc.constraint_name
-            FROM information_schema.table_constraints AS tc
-            JOIN information_schema.key_column_usage AS kcu
-                ON tc.constraint_name = kcu.constraint_name
-                AND tc.table_schema = kcu.table_schema
-            JOIN information_schema.constraint_column_usage AS ccu
-                ON ccu.constraint_name = tc.constraint_name
-                AND ccu.table_schema = tc.table_schema
-            JOIN information_schema.referential_constraints AS rc
-                ON rc.constraint_name = tc.constraint_name
-            WHERE tc.constraint_type = 'FOREIGN KEY'
-            AND tc.table_schema = %s
-            AND tc.table_name = %s
+                a.attname AS column_name,
+                fns.nspname AS foreign_table_schema,
+                frel.relname AS foreign_table,
+                fa.attname AS foreign_column,
+                con.conname AS constraint_name
+            FROM pg_catalog.pg_constraint con
+            CROSS JOIN LATERAL unnest(con.conkey, con.confkey) AS k(attnum, fattnum)
+            JOIN pg_catalog.pg_attribute a
+                ON a.attrelid = con.conrelid AND a.attnum = k.attnum
+            JOIN pg_catalog.pg_class frel ON frel.oid = con.confrelid
+            JOIN pg_catalog.pg_namespace fns ON fns.oid = frel.relnamespace
+            JOIN pg_catalog.pg_attribute fa
+                ON fa.attrelid = con.confrelid AND fa.attnum = k.fattnum
+            WHERE con.contype = 'f'
+            AND con.conrelid = (SELECT oid FROM target)
         ),
         primary_key AS (
-            SELECT kcu.column_name
-            FROM information_schema.table_constraints tc
-            JOIN information_schema.key_column_usage kcu
-                ON tc.constraint_name = kcu.constraint_name
-                AND tc.table_schema = kcu.table_schema
-            WHERE tc.constraint_type = 'PRIMARY KEY'
-            AND tc.table_schema = %s
-            AND tc.table_name = %s
+            SELECT a.attname AS column_name
+            FROM pg_catalog.pg_constraint con
+            JOIN pg_catalog.pg_attribute a
+                ON a.attrelid = con.conrelid AND a.attnum = ANY(con.conkey)
+            WHERE con.contype = 'p'
+            AND con.conrelid = (SELECT oid FROM target)
         ),
         check_constraints AS (
             SELECT
-                ccu.column_name,
+                a.attname AS column_name,
                 con.conname as constraint_name,
                 pg_get_constraintdef(con.oid) as constraint_definition
-            FROM pg_constraint con
-            JOIN pg_class rel ON rel.oid = con.conrelid
-            JOIN pg_namespace ns ON ns.oid = rel.relnamespace
-            LEFT JOIN information_schema.constraint_column_usage ccu
-                ON ccu.constraint_name = con.conname
-                AND ccu.table_schema = ns.nspname
+            FROM pg_catalog.pg_constraint con
+            JOIN pg_catalog.pg_attribute a
+                ON a.attrelid = con.conrelid AND a.attnum = ANY(con.conkey)
             WHERE con.contype = 'c'
-            AND ns.nspname = %s
-            AND rel.relname = %s
+            AND con.conrelid = (SELECT oid FROM target)
         ),
         indexes AS (
             SELECT
                 a.attname as column_name,
-                string_agg(i.indexname, ', ') as index_names
-            FROM pg_indexes i
-            JOIN pg_class c ON c.relname = i.indexname
-            JOIN pg_index idx ON idx.indexrelid = c.oid
-            JOIN pg_attribute a ON a.attrelid = idx.indrelid
+                string_agg(ic.relname, ', ') as index_names
+            FROM pg_catalog.pg_index idx
+            JOIN pg_catalog.pg_class ic ON ic.oid = idx.indexrelid
+            JOIN pg_catalog.pg_attribute a ON a.attrelid = idx.indrelid
                 AND a.attnum = ANY(idx.indkey)
-            WHERE i.schemaname = %s
-            AND i.tablename = %s
+            WHERE idx.indrelid = (SELECT oid FROM target)
             GROUP BY a.attname
         )
         SELECT
@@ -268,11 +270,10 @@ def get_columns(db_service: DatabaseService,
         ORDER BY ci.ordinal_position
     """
 
-    params = (schema, table_name, schema, table_name, schema, table_name,
-              schema, table_name, schema, table_name)
+    params = (schema, table_name, schema, table_name)
 
     try:
-        results = db_service.execute_readonly_query(query, params)
+        results = db_service.execute_readonly_query(query, params, prepare='mcp_get_columns')
 
         if not results:
             raise InvalidTableError(
@@ -343,20 +344,27 @@ def get_columns(db_service: DatabaseService,
         # Get table-level constraints
         constraint_query = """
             SELECT
-                tc.constraint_type,
-                tc.constraint_name,
+                CASE con.contype
+                    WHEN 'p' THEN 'PRIMARY KEY'
+                    WHEN 'f' THEN 'FOREIGN KEY'
+                    WHEN 'u' THEN 'UNIQUE'
+                    WHEN 'c' THEN 'CHECK'
+                END AS constraint_type,
+                con.conname AS constraint_name,
                 pg_get_constraintdef(con.oid, true) as definition
-            FROM information_schema.table_constraints tc
-            JOIN pg_constraint con ON con.conname = tc.constraint_name
-            JOIN pg_namespace ns ON ns.nspname = tc.table_schema
-            WHERE tc.table_schema = %s
-            AND tc.table_name = %s
-            ORDER BY tc.constraint_type
+            FROM pg_catalog.pg_constraint con
+            JOIN pg_catalog.pg_class rel ON rel.oid = con.conrelid
+            JOIN pg_catalog.pg_namespace ns ON ns.oid = rel.relnamespace
+            WHERE ns.nspname = %s
+            AND rel.relname = %s
+            AND con.contype IN ('p', 'f', 'u', 'c')
+            ORDER BY constraint_type
         """
 
         constraint_results = db_service.execute_readonly_query(
             constraint_query,
-            (schema, table_name)
+            (schema, table_name),
+            prepare='mcp_get_column_constraints'
         )
 
         for con in constraint_results:
@@ -398,6 +406,66 @@ def get_columns(db_service: DatabaseService,
         raise MCPError(f"Failed to describe table: {str(e)}", recoverable=True)
 
 
+def _format_table_stats(stats: Dict[str, Any], detailed: bool) -> Dict[str, Any]:
+    """Format a table statistics row for the get_table_stats response.
+
+    Args:
+        stats: Row from the table statistics query
+        detailed: Include index size, full vacuum/analyze history and
+            activity counters (single-table response)
+
+    Returns:
+        Formatted statistics dictionary
+    """
+    formatted = {
+        'table_name': stats['table_name'],
+        'schema': stats['schema_name'],
+        'row_count': stats['row_count'] or 0,
+        'dead_rows': stats['dead_rows'] or 0,
+        'table_size': stats['table_size'],
+        'table_size_bytes': stats['table_size_bytes'] or 0,
+    }
+    if detailed:
+        formatted['index_size'] = stats['index_size']
+        formatted['index_size_bytes'] = stats['index_size_bytes'] or 0
+    formatted.update({
+        'toast_size': stats['toast_size'],
+        'toast_size_bytes': stats['toast_size_bytes'] or 0,
+        'total_relation_size': stats['total_relation_size'],
+        'total_relation_size_bytes': stats['total_relation_size_bytes'] or 0,
+        'index_count': stats['index_count'] or 0,
+    })
+
+    if not detailed:
+        formatted.update({
+            'index_scan_ratio': float(stats['index_scan_ratio'] or 0),
+            'last_vacuum': stats['last_vacuum'] or 'Never',
+            'last_analyze': stats['last_analyze'] or 'Never'
+        })
+        return formatted
+
+    formatted.update({
+        'last_vacuum': stats['last_vacuum'] or 'Never',
+        'last_autovacuum': stats['last_autovacuum'] or 'Never',
+        'vacuum_count': stats['vacuum_count'] or 0,
+        'autovacuum_count': stats['autovacuum_count'] or 0,
+        'last_analyze': stats['last_analyze'] or 'Never',
+        'last_autoanalyze': stats['last_autoanalyze'] or 'Never',
+        'analyze_count': stats['analyze_count'] or 0,
+        'autoanalyze_count': stats['autoanalyze_count'] or 0,
+        'activity': {
+            'rows_inserted': stats['rows_inserted'] or 0,
+            'rows_updated': stats['rows_updated'] or 0,
+            'rows_deleted': stats['rows_deleted'] or 0,
+            'rows_hot_updated': stats['rows_hot_updated'] or 0,
+            'sequential_scans': stats['sequential_scans'] or 0,
+            'index_scans': stats['index_scans'] or 0,
+            'index_scan_ratio': float(stats['index_scan_ratio'] or 0)
+        }
+    })
+    return formatted
+
+
 def get_table_stats(db_service: DatabaseService,
                    table_name: Optional[str] = None,
                    table_names: Optional[List[str]] = None) -> Dict[str, Any]:
@@ -431,9 +499,9 @@ def get_table_stats(db_service: DatabaseService,
     # Remove duplicates while preserving order
     tables_to_query = list(dict.fromkeys(tables_to_query))
 
-    # Build query for multiple tables with enhanced metrics
-    placeholders = ','.join(['%s'] * len(tables_to_query))
-    query = f"""
+    # All tables are matched against one array parameter, so the query text
+    # is the same for any number of tables and can be prepared once
+    query = """
         SELECT
             n.nspname as schema_name,
             t.tablename as table_name,
@@ -482,12 +550,13 @@ def get_table_stats(db_service: DatabaseService,
         JOIN pg_namespace n ON n.oid = c.relnamespace AND n.nspname = t.schemaname
         LEFT JOIN pg_stat_user_tables s ON s.schemaname = t.schemaname
             AND s.relname = t.tablename
-        WHERE t.tablename IN ({placeholders})
+        WHERE t.tablename = ANY(%s::name[])
         ORDER BY t.schemaname, t.tablename
     """
 
     try:
-        results = db_service.execute_readonly_query(query, tuple(tables_to_query))
+        results = db_service.execute_readonly_query(query, (tables_to_query,),
+                                                    prepare='mcp_table_stats')
 
         if not results:
             if len(tables_to_query) == 1:
@@ -502,59 +571,10 @@ def get_table_stats(db_service: DatabaseService,
         # Format results based on single or multiple tables
         if len(results) == 1:
             # Single table - return direct stats with enhanced metrics
-            stats = results[0]
-            return {
-                'table_name': stats['table_name'],
-                'schema': stats['schema_name'],
-                'row_count': stats['row_count'] or 0,
-                'dead_rows': stats['dead_rows'] or 0,
-                'table_size': stats['table_size'],
-                'table_size_bytes': stats['table_size_bytes'] or 0,
-                'index_size': stats['index_size'],
-                'index_size_bytes': stats['index_size_bytes'] or 0,
-                'toast_size': stats['toast_size'],
-                'toast_size_bytes': stats['toast_size_bytes'] or 0,
-                'total_relation_size': stats['total_relation_size'],
-                'total_relation_size_bytes': stats['total_relation_size_bytes'] or 0,
-                'index_count': stats['index_count'] or 0,
-                'last_vacuum': stats['last_vacuum'] if stats['last_vacuum'] else 'Never',
-                'last_autovacuum': stats['last_autovacuum'] if stats['last_autovacuum'] else 'Never',
-                'vacuum_count': stats['vacuum_count'] or 0,
-                'autovacuum_count': stats['autovacuum_count'] or 0,
-                'last_analyze': stats['last_analyze'] if stats['last_analyze'] else 'Never',
-                'last_autoanalyze': stats['last_autoanalyze'] if stats['last_autoanalyze'] else 'Never',
-                'analyze_count': stats['analyze_count'] or 0,
-                'autoanalyze_count': stats['autoanalyze_count'] or 0,
-                'activity': {
-                    'rows_inserted': stats['rows_inserted'] or 0,
-                    'rows_updated': stats['rows_updated'] or 0,
-                    'rows_deleted': stats['rows_deleted'] or 0,
-                    'rows_hot_updated': stats['rows_hot_updated'] or 0,
-                    'sequential_scans': stats['sequential_scans'] or 0,
-                    'index_scans': stats['index_scans'] or 0,
-                    'index_scan_ratio': float(stats['index_scan_ratio'] or 0)
-                }
-            }
+            return _format_table_stats(results[0], detailed=True)
         else:
             # Multiple tables - return array with enhanced metrics
-            formatted_stats = []
-            for stats in results:
-                formatted_stats.append({
-                    'table_name': stats['table_name'],
-                    'schema': stats['schema_name'],
-                    'row_count': stats['row_count'] or 0,
-                    'dead_rows': stats['dead_rows'] or 0,
-                    'table_size': stats['table_size'],
-                    'table_size_bytes': stats['table_size_bytes'] or 0,
-                    'toast_size': stats['toast_size'],
-                    'toast_size_bytes': stats['toast_size_bytes'] or 0,
-                    'total_relation_size': stats['total_relation_size'],
-                    'total_relation_size_bytes': stats['total_relation_size_bytes'] or 0,
-                    'index_count': stats['index_count'] or 0,
-                    'index_scan_ratio': float(stats['index_scan_ratio'] or 0),
-                    'last_vacuum': stats['last_vacuum'] if stats['last_vacuum'] else 'Never',
-                    'last_analyze': stats['last_analyze'] if stats['last_analyze'] else 'Never'
-                })
+            formatted_stats = [_format_table_stats(stats, detailed=False) for stats in results]
 
             return {
                 'table_count': len(formatted_stats),
@@ -610,7 +630,7 @@ def get_column_statistics(db_service: DatabaseService,
                                 'double precision', 'smallint', 'decimal')
             """
             numeric_results = db_service.execute_readonly_query(
-                numeric_query, (schema, table_name)
+                numeric_query, (schema, table_name), prepare='mcp_numeric_columns'
             )
 
             if not numeric_results:
@@ -619,7 +639,8 @@ def get_column_statistics(db_service: DatabaseService,
                     SELECT 1 FROM information_schema.tables
                     WHERE table_schema = %s AND table_name = %s
                 """
-                exists = db_service.execute_readonly_query(table_check, (schema, table_name))
+                exists = db_service.execute_readonly_query(table_check, (schema, table_name),
+                                                           prepare='mcp_table_exists')
                 if not exists:
                     raise InvalidTableError(
                         f"Table '{schema}.{table_name}' not found"
@@ -632,121 +653,27 @@ def get_column_statistics(db_service: DatabaseService,
 
             column_names = [row['column_name'] for row in numeric_results]
 
-        # Analyze each column
-        stats = {}
-        columns_analyzed = []
-
-        for column in column_names:
-            # Build comprehensive statistics query using parameterized identifiers
-            stats_query = f"""
-                WITH stats AS (
-                    SELECT
-                        COUNT(*) as count,
-                        COUNT("{column}") as non_null_count,
-                        COUNT(DISTINCT "{column}") as distinct_count,
-                        AVG("{column}"::numeric) as mean,
-                        STDDEV("{column}"::numeric) as std_dev,
-                        VARIANCE("{column}"::numeric) as variance,
-                        MIN("{column}") as min,
-                        MAX("{column}") as max,
-                        PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY "{column}") as q1,
-                        PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY "{column}") as median,
-                        PERCENTILE_CONT(0.75) WITHIN GROUP (ORDER BY "{column}") as q3,
-                        PERCENTILE_CONT(0.05) WITHIN GROUP (ORDER BY "{column}") as p5,
-                        PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY "{column}") as p95,
-                        MODE() WITHIN GROUP (ORDER BY "{column}") as mode
-                    FROM "{schema}"."{table_name}"
-                )
-                SELECT
-                    *,
-                    (q3 - q1) as iqr,
-                    (q1 - 1.5 * (q3 - q1)) as lower_fence,
-                    (q3 + 1.5 * (q3 - q1)) as upper_fence,
-                    (count - non_null_count) as null_count,
-                    CASE
-                        WHEN std_dev > 0 THEN ((mean - median) * 3) / std_dev
-                        ELSE 0
-                    END as skewness
-                FROM stats
-            """
-
-            try:
-                result = db_service.execute_readonly_query(stats_query)[0]
-
-                # Basic statistics
-                col_stats = {
-                    'count': result['count'],
-                    'non_null_count': result['non_null_count'],
-                    'null_count': result['null_count'],
-                    'null_percentage': round((result['null_count'] / result['count'] * 100), 2) if result['count'] > 0 else 0,
-                    'distinct_count': result['distinct_count'],
-                    'mean': float(result['mean']) if result['mean'] else None,
-                    'std': float(result['std_dev']) if result['std_dev'] else None,
-                    'variance': float(result['variance']) if result['variance'] else None,
-                    'min': float(result['min']) if result['min'] else None,
-                    'max': float(result['max']) if result['max'] else None,
-                    'range': float(result['max'] - result['min']) if result['max'] and result['min'] else None,
-                    'percentiles': {
-                        '5%': float(result['p5']) if result['p5'] else None,
-                        '25%': float(result['q1']) if result['q1'] else None,
-                        '50%': float(result['median']) if result['median'] else None,
-                        '75%': float(result['q3']) if result['q3'] else None,
-                        '95%': float(result['p95']) if result['p95'] else None
-                    },
-                    'iqr': float(result['iqr']) if result['iqr'] else None,
-                    'mode': float(result['mode']) if result['mode'] else None,
-                    'skewness': float(result['skewness']) if result['skewness'] else None
-                }
+        column_names = list(dict.fromkeys(column_names))
+        method = outlier_method if include_outliers else None
+
+        try:
+            stats = _analyze_columns(db_service, schema, table_name, column_names, method)
+        except Exception as e:
+            # One unsuitable column (e.g. non-numeric) fails the combined
+            # query, so fall back to analyzing columns one at a time
+            stats = {}
+            if len(column_names) == 1:
+                logger.warning(f"Could not analyze column {column_names[0]}: {e}")
+            else:
+                logger.warning(f"Combined column statistics failed, analyzing columns separately: {e}")
+                for column in column_names:
+                    try:
+                        stats.update(_analyze_columns(db_service, schema, table_name, [column], method))
+                    except Exception as col_error:
+                        logger.warning(f"Could not analyze column {column}: {col_error}")
+                        # Continue with other columns
 
-                # Outlier detection
-                if include_outliers and result['non_null_count'] > 0:
-                    if outlier_method == 'iqr' and result['lower_fence'] is not None:
-                        # IQR method
-                        outlier_query = f"""
-                            SELECT COUNT(*) as outlier_count
-                            FROM "{schema}"."{table_name}"
-                            WHERE "{column}" IS NOT NULL
-                            AND ("{column}" < %s OR "{column}" > %s)
-                        """
-                        outlier_result = db_service.execute_readonly_query(
-                            outlier_query,
-                            (result['lower_fence'], result['upper_fence'])
-                        )[0]
-
-                        col_stats['outliers'] = {
-                            'method': 'IQR',
-                            'lower_fence': float(result['lower_fence']) if result['lower_fence'] else None,
-                            'upper_fence': float(result['upper_fence']) if result['upper_fence'] else None,
-                            'count': outlier_result['outlier_count'],
-                            'percentage': round((outlier_result['outlier_count'] / result['non_null_count'] * 100), 2)
-                        }
-
-                    elif outlier_method == 'zscore' and result['std_dev'] and result['std_dev'] > 0:
-                        # Z-score method (values beyond 3 standard deviations)
-                        zscore_query = f"""
-                            SELECT COUNT(*) as outlier_count
-                            FROM "{schema}"."{table_name}"
-                            WHERE "{column}" IS NOT NULL
-                            AND ABS(("{column}" - %s) / %s) > 3
-                        """
-                        zscore_result = db_service.execute_readonly_query(
-                            zscore_query,
-                            (result['mean'], result['std_dev'])
-                        )[0]
-
-                        col_stats['outliers'] = {
-                            'method': 'Z-score',
-                            'threshold': 3,
-                            'count': zscore_result['outlier_count'],
-                            'percentage': round((zscore_result['outlier_count'] / result['non_null_count'] * 100), 2)
-                        }
-
-                stats[column] = col_stats
-                columns_analyzed.append(column)
-
-            except Exception as e:
-                logger.warning(f"Could not analyze column {column}: {e}")
-                # Continue with other columns
+        columns_analyzed = list(stats)
 
         if not stats:
             raise MCPError("No columns could be analyzed", recoverable=False)
@@ -764,4 +691,168 @@ def get_column_statistics(db_service: DatabaseService,
         raise
     except Exception as e:
         logger.error(f"Error getting column statistics: {e}")
-        raise MCPError(f"Failed to get column statistics: {str(e)}", recoverable=True)
\ No newline at end of file
+        raise MCPError(f"Failed to get column statistics: {str(e)}", recoverable=True)
+
+
+def _column_stats_query(schema: str, table_name: str, columns: List[str],
+                        outlier_method: Optional[str]) -> str:
+    """Build one query computing statistics for several columns.
+
+    Every column's aggregates are computed in a single scan of the table;
+    with outlier detection, a second scan counts each column's outliers
+    against the bounds from the first. Output columns are prefixed c0_, c1_,
+    ... in the order of ``columns``.
+
+    Args:
+        schema: Schema name
+        table_name: Table name
+        columns: Columns to analyze
+        outlier_method: 'iqr', 'zscore', or None to skip outlier counts
+
+    Returns:
+        SQL query returning a single row
+    """
+    aggregates = ['\n                COUNT(*) as count']
+    outlier_counts = []
+    for i, column in enumerate(columns):
+        p = f"c{i}_"
+        aggregates.append(f"""
+                COUNT("{column}") as {p}non_null_count,
+                COUNT(DISTINCT "{column}") as {p}distinct_count,
+                AVG("{column}"::numeric) as {p}mean,
+                STDDEV("{column}"::numeric) as {p}std_dev,
+                VARIANCE("{column}"::numeric) as {p}variance,
+                MIN("{column}") as {p}min,
+                MAX("{column}") as {p}max,
+                PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY "{column}") as {p}q1,
+                PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY "{column}") as {p}median,
+                PERCENTILE_CONT(0.75) WITHIN GROUP (ORDER BY "{column}") as {p}q3,
+                PERCENTILE_CONT(0.05) WITHIN GROUP (ORDER BY "{column}") as {p}p5,
+                PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY "{column}") as {p}p95,
+                MODE() WITHIN GROUP (ORDER BY "{column}") as {p}mode""")
+
+        # NULL values and NULL bounds compare as unknown and are not counted
+        if outlier_method == 'iqr':
+            outlier_counts.append(f"""
+                SUM(CASE
+                    WHEN x."{column}" < s.{p}q1 - 1.5 * (s.{p}q3 - s.{p}q1)
+                      OR x."{column}" > s.{p}q3 + 1.5 * (s.{p}q3 - s.{p}q1) THEN 1
+                    ELSE 0
+                END) as {p}outlier_count""")
+        elif outlier_method == 'zscore':
+            outlier_counts.append(f"""
+                SUM(CASE
+                    WHEN ABS((x."{column}" - s.{p}mean) / NULLIF(s.{p}std_dev, 0)) > 3 THEN 1
+                    ELSE 0
+                END) as {p}outlier_count""")
+
+    stats_query = f"""
+            SELECT{','.join(aggregates)}
+            FROM "{schema}"."{table_name}"
+        """
+    if not outlier_counts:
+        return stats_query
+
+    return f"""
+        WITH stats AS ({stats_query}),
+        outliers AS (
+            SELECT{','.join(outlier_counts)}
+            FROM "{schema}"."{table_name}" x
+            CROSS JOIN stats s
+        )
+        SELECT * FROM stats CROSS JOIN outliers
+    """
+
+
+def _analyze_columns(db_service: DatabaseService, schema: str, table_name: str,
+                     columns: List[str], outlier_method: Optional[str]) -> Dict[str, Dict[str, Any]]:
+    """Compute statistics for several columns with one query.
+
+    Args:
+        db_service: Database service instance
+        schema: Schema name
+        table_name: Table name
+        columns: Columns to analyze
+        outlier_method: 'iqr', 'zscore', or None to skip outlier detection
+
+    Returns:
+        Dictionary mapping each column to its statistics
+    """
+    row = db_service.execute_readonly_query(
+        _column_stats_query(schema, table_name, columns, outlier_method)
+    )[0]
+
+    stats = {}
+    for i, column in enumerate(columns):
+        result = {key[len(f"c{i}_"):]: value for key, value in row.items()
+                  if key.startswith(f"c{i}_")}
+        result['count'] = row['count']
+        stats[column] = _format_column_stats(result, outlier_method)
+    return stats
+
+
+def _format_column_stats(result: Dict[str, Any], outlier_method: Optional[str]) -> Dict[str, Any]:
+    """Format one column's raw aggregates as column statistics.
+
+    Args:
+        result: Aggregates for the column, without their column prefix
+        outlier_method: 'iqr', 'zscore', or None if outliers were not counted
+
+    Returns:
+        Dictionary with the column's statistics
+    """
+    q1, q3 = result['q1'], result['q3']
+    iqr = q3 - q1 if q1 is not None and q3 is not None else None
+    lower_fence = q1 - 1.5 * iqr if iqr is not None else None
+    upper_fence = q3 + 1.5 * iqr if iqr is not None else None
+    null_count = result['count'] - result['non_null_count']
+    skewness = (
+        ((float(result['mean']) - result['median']) * 3) / float(result['std_dev'])
+        if result['std_dev'] and result['std_dev'] > 0 else 0
+    )
+
+    # Basic statistics
+    col_stats = {
+        'count': result['count'],
+        'non_null_count': result['non_null_count'],
+        'null_count': null_count,
+        'null_percentage': round((null_count / result['count'] * 100), 2) if result['count'] > 0 else 0,
+        'distinct_count': result['distinct_count'],
+        'mean': float(result['mean']) if result['mean'] else None,
+        'std': float(result['std_dev']) if result['std_dev'] else None,
+        'variance': float(result['variance']) if result['variance'] else None,
+        'min': float(result['min']) if result['min'] else None,
+        'max': float(result['max']) if result['max'] else None,
+        'range': float(result['max'] - result['min']) if result['max'] and result['min'] else None,
+        'percentiles': {
+            '5%': float(result['p5']) if result['p5'] else None,
+            '25%': float(q1) if q1 else None,
+            '50%': float(result['median']) if result['median'] else None,
+            '75%': float(q3) if q3 else None,
+            '95%': float(result['p95']) if result['p95'] else None
+        },
+        'iqr': float(iqr) if iqr else None,
+        'mode': float(result['mode']) if result['mode'] else None,
+        'skewness': float(skewness) if skewness else None
+    }
+
+    # Outlier detection
+    if outlier_method and result['non_null_count'] > 0:
+        outlier_count = result.get('outlier_count') or 0
+        if outlier_method == 'iqr' and lower_fence is not None:
+            col_stats['outliers'] = {
+                'method': 'IQR',
+                'lower_fence': float(lower_fence) if lower_fence else None,
+                'upper_fence': float(upper_fence) if upper_fence else None,
+                'count': outlier_count,
+                'percentage': round((outlier_count / result['non_null_count'] * 100), 2)
+            }
+        elif outlier_method == 'zscore' and result['std_dev'] and result['std_dev'] > 0:
+            col_stats['outliers'] = {
+                'method': 'Z-score',
+                'threshold': 3,
+                'count': outlier_count,
+                'percentage': round((outlier_count / result['non_null_count'] * 100), 2)
+            }
+
+    return col_stats
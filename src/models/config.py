@@ -2,11 +2,41 @@
 
 import os
 import yaml
+from functools import cached_property
 from urllib.parse import urlparse
 from typing import Dict, Any, Optional
 from pathlib import Path
 from dotenv import load_dotenv
 
+# The connection pool opens this many connections up front, so no pool
+# may be configured smaller
+MIN_POOL_SIZE = 2
+
+
+def resolve_pool_size(configured: Any = None) -> int:
+    """Resolve the connection pool size from config or the environment.
+
+    Args:
+        configured: Profile's max_connections, if set; otherwise DB_POOL_SIZE
+            or a default scaled to the host's CPU count is used
+
+    Returns:
+        Pool size, at least MIN_POOL_SIZE
+
+    Raises:
+        ValueError: If the configured value is not an integer
+    """
+    if configured is None:
+        # Default scales with the host so concurrent tool calls don't queue
+        # on a handful of connections, capped to spare the server
+        default = min(32, 8 * (os.cpu_count() or 1))
+        configured = os.getenv('DB_POOL_SIZE', str(default))
+    try:
+        size = int(configured)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid pool size (max_connections/DB_POOL_SIZE): {configured}")
+    return max(MIN_POOL_SIZE, size)
+
 
 class DatabaseProfile:
     """Represents a single database profile configuration."""
@@ -61,14 +91,20 @@ class DatabaseProfile:
     def password(self) -> str:
         return getattr(self, '_password', '')
 
-    @property
+    # Timeouts are resolved from connection options/environment on first
+    # access and then kept, since the profile does not change afterwards.
+    @cached_property
     def connect_timeout(self) -> int:
         return self.connection_options.get('connect_timeout', int(os.getenv('DB_CONNECT_TIMEOUT', '10')))
 
-    @property
+    @cached_property
     def query_timeout(self) -> int:
         return self.connection_options.get('query_timeout', int(os.getenv('DB_QUERY_TIMEOUT', '30')))
 
+    @cached_property
+    def pool_size(self) -> int:
+        return resolve_pool_size(self.connection_options.get('max_connections'))
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert profile to dictionary for psycopg2."""
         return {
@@ -85,7 +121,10 @@ class DatabaseConfig:
     """Enhanced database configuration with multi-profile support."""
     
     def __init__(self, profile_name: Optional[str] = None):
-        load_dotenv()
+        # Containers are configured through their environment and ship no
+        # .env file, so skip the filesystem scan there
+        if not os.getenv('DOCKER_ENV'):
+            load_dotenv()
 
         self.profiles: Dict[str, DatabaseProfile] = {}
         self.current_profile: Optional[DatabaseProfile] = None
@@ -253,6 +292,10 @@ class DatabaseConfig:
     def query_timeout(self) -> int:
         return self.current_profile.query_timeout if self.current_profile else 30
 
+    @property
+    def pool_size(self) -> int:
+        return self.current_profile.pool_size if self.current_profile else resolve_pool_size()
+
     def switch_profile(self, profile_name: str) -> bool:
         """Switch to a different database profile."""
         if profile_name not in self.profiles:
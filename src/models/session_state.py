@@ -6,7 +6,7 @@ tables have been inspected and ensure proper sequencing of MCP tool calls.
 
 import threading
 from typing import Set, Optional
-from lib.logging_config import get_logger
+from src.lib.logging_config import get_logger
 
 logger = get_logger(__name__)
 
@@ -35,7 +35,7 @@ class SessionState:
         """Mark that tables have been discovered via discover_tables."""
         with self._lock:
             self.tables_discovered = True
-            logger.debug(f"Session {self.session_id}: Tables discovered")
+            logger.debug("Session %s: Tables discovered", self.session_id)
 
     def add_inspected_table(self, table_name: str) -> None:
         """Add a table to the inspected tables set.
@@ -45,8 +45,8 @@ class SessionState:
         """
         with self._lock:
             self.inspected_tables.add(table_name.lower())  # Normalize to lowercase
-            logger.debug(f"Session {self.session_id}: Added inspected table '{table_name}'. "
-                        f"Total inspected: {len(self.inspected_tables)}")
+            logger.debug("Session %s: Added inspected table '%s'. Total inspected: %d",
+                         self.session_id, table_name, len(self.inspected_tables))
 
     def is_table_inspected(self, table_name: str) -> bool:
         """Check if a table has been inspected.
@@ -74,8 +74,8 @@ class SessionState:
                           if t.lower() not in self.inspected_tables}
 
             if uninspected:
-                logger.warning(f"Session {self.session_id}: Found {len(uninspected)} uninspected tables: "
-                              f"{', '.join(uninspected)}")
+                logger.warning("Session %s: Found %d uninspected tables: %s",
+                               self.session_id, len(uninspected), ', '.join(uninspected))
 
             return uninspected
 
@@ -101,12 +101,13 @@ class SessionState:
                     "next_step": f"inspect_table_schema('{uninspected_list[0]}')"
                 }
 
-                logger.warning(f"Session {self.session_id}: Query validation failed. "
-                              f"Missing inspections for: {', '.join(uninspected_list)}")
+                logger.warning("Session %s: Query validation failed. Missing inspections for: %s",
+                               self.session_id, ', '.join(uninspected_list))
 
                 return error_response
 
-            logger.info(f"Session {self.session_id}: Query validation passed for {len(table_names)} tables")
+            logger.info("Session %s: Query validation passed for %d tables",
+                        self.session_id, len(table_names))
             return None
 
     def reset(self) -> None:
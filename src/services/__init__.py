@@ -2,11 +2,19 @@
 
 from .database_service import DatabaseService
 from .query_utils import validate_table_name, escape_identifier
-from .health_api import HealthAPI
 
 __all__ = [
     'DatabaseService',
     'validate_table_name',
     'escape_identifier',
     'HealthAPI'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # HealthAPI pulls in FastAPI and uvicorn, so it is only imported when
+    # asked for rather than by everything that uses the database service
+    if name == 'HealthAPI':
+        from .health_api import HealthAPI
+        return HealthAPI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
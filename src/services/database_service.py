@@ -1,9 +1,12 @@
 """Database service for PostgreSQL connections."""
 
+import re
+from itertools import count
 import psycopg2
 from psycopg2 import pool
+from psycopg2.extensions import connection as _PgConnection
 from psycopg2.extras import RealDictCursor
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 from contextlib import contextmanager
 
 from src.models.error_types import ConnectionError, MCPError
@@ -12,6 +15,34 @@ from src.utils.logger import get_logger, log_database_query, log_error_with_cont
 # Module logger
 logger = get_logger(__name__)
 
+# psycopg2 placeholders, rewritten to $n for server-side PREPARE
+_PLACEHOLDER_RE = re.compile(r'%([%s])')
+
+
+class _PreparingConnection(_PgConnection):
+    """Connection that remembers which named statements it has prepared."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared_statements: Set[str] = set()
+        # Names the server refused to PREPARE; these run unprepared from then on
+        self.unpreparable_statements: Set[str] = set()
+
+
+def _to_prepared_sql(query: str) -> str:
+    """Rewrite a psycopg2 query's %s placeholders as $1..$n for PREPARE.
+
+    Args:
+        query: SQL query using %s placeholders (and %% for literal %)
+
+    Returns:
+        Equivalent SQL using positional $n parameters
+    """
+    counter = count(1)
+    return _PLACEHOLDER_RE.sub(
+        lambda m: '%' if m.group(1) == '%' else f'${next(counter)}', query
+    )
+
 
 class DatabaseService:
     """Service for managing PostgreSQL database connections."""
@@ -47,7 +78,8 @@ class DatabaseService:
                 database=self.config['database'],
                 user=self.config['user'],
                 password=self.config['password'],
-                connect_timeout=self.config.get('connect_timeout', 10)
+                connect_timeout=self.config.get('connect_timeout', 10),
+                connection_factory=_PreparingConnection
             )
             logger.info(f"Database connection pool established (size: {self.pool_size})")
             return True
@@ -77,7 +109,7 @@ class DatabaseService:
             logger.debug("Getting connection from pool")
             conn = self.pool.getconn()
             if conn:
-                logger.debug(f"Connection acquired from pool")
+                logger.debug("Connection acquired from pool")
                 yield conn
             else:
                 raise ConnectionError("Failed to get connection from pool")
@@ -85,7 +117,9 @@ class DatabaseService:
             raise ConnectionError(f"Connection pool exhausted: {str(e)}")
         finally:
             if conn:
-                self.pool.putconn(conn)
+                # A connection that broke during use is discarded instead of
+                # being handed to the next caller; the pool opens a new one
+                self.pool.putconn(conn, close=bool(conn.closed))
     
     def execute_query(self, query: str, params: Optional[tuple] = None) -> List[Dict[str, Any]]:
         """Execute a SELECT query and return results.
@@ -112,7 +146,7 @@ class DatabaseService:
 
                     # Fetch all results
                     results = cursor.fetchall()
-                    logger.debug(f"Query returned {len(results)} rows")
+                    logger.debug("Query returned %d rows", len(results))
 
                     # Convert RealDictRow to regular dict
                     return [dict(row) for row in results]
@@ -136,7 +170,8 @@ class DatabaseService:
                 log_error_with_context(e, {'query': query[:100], 'params': params}, logger)
                 raise MCPError(f"Unexpected error: {str(e)}", recoverable=False)
 
-    def execute_readonly_query(self, query: str, params: Optional[tuple] = None) -> List[Dict[str, Any]]:
+    def execute_readonly_query(self, query: str, params: Optional[tuple] = None,
+                               prepare: Optional[str] = None) -> List[Dict[str, Any]]:
         """Execute a query in a read-only transaction with automatic rollback.
 
         This ensures safety by preventing any modifications to the database,
@@ -145,6 +180,9 @@ class DatabaseService:
         Args:
             query: SQL query to execute
             params: Query parameters for parameterized queries
+            prepare: Optional statement name. Fixed-text queries given a name
+                are prepared once per connection and then only executed,
+                skipping server-side parsing and planning on repeat calls
 
         Returns:
             List of dictionaries containing query results
@@ -164,11 +202,33 @@ class DatabaseService:
                     cursor.execute(f"SET statement_timeout = {self.query_timeout}")
 
                     # Execute the actual query
-                    cursor.execute(query, params)
+                    if prepare and prepare not in conn.unpreparable_statements \
+                            and prepare not in conn.prepared_statements:
+                        # A failed PREPARE would abort the transaction, so it
+                        # runs under a savepoint and the query falls back to
+                        # a plain execute rather than failing on every call
+                        cursor.execute("SAVEPOINT mcp_prepare")
+                        try:
+                            cursor.execute(f"PREPARE {prepare} AS {_to_prepared_sql(query)}")
+                        except psycopg2.Error as e:
+                            logger.warning("Could not prepare %s, running it unprepared: %s", prepare, e)
+                            cursor.execute("ROLLBACK TO SAVEPOINT mcp_prepare")
+                            conn.unpreparable_statements.add(prepare)
+                        else:
+                            conn.prepared_statements.add(prepare)
+
+                    if prepare in conn.prepared_statements:
+                        # Prepared statements outlive the transaction, so
+                        # the ROLLBACK below keeps them for the next call
+                        placeholders = ', '.join(['%s'] * len(params or ()))
+                        cursor.execute(f"EXECUTE {prepare}({placeholders})" if placeholders
+                                       else f"EXECUTE {prepare}", params)
+                    else:
+                        cursor.execute(query, params)
 
                     # Fetch all results
                     results = cursor.fetchall()
-                    logger.debug(f"Read-only query returned {len(results)} rows")
+                    logger.debug("Read-only query returned %d rows", len(results))
 
                     # Always rollback to end the transaction
                     cursor.execute("ROLLBACK")
@@ -1,12 +1,13 @@
 """Health monitoring API service."""
 
 import logging
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, Optional, Union
 from datetime import datetime
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 import uvicorn
 
-from models.database_profiles import (
+from src.models.database_profiles import (
     DatabaseSwitchRequest,
     DatabaseConnectionTest,
     DatabaseSwitchResponse,
@@ -21,7 +22,8 @@ logger = logging.getLogger(__name__)
 class HealthAPI:
     """Health monitoring API service running independently from MCP."""
 
-    def __init__(self, db_service=None, db_config=None, host: str = "0.0.0.0", port: int = 8080):
+    def __init__(self, db_service=None, db_config=None, host: str = "0.0.0.0", port: int = 8080,
+                 max_db_connections: int = 1):
         """Initialize health API service.
 
         Args:
@@ -29,6 +31,8 @@ class HealthAPI:
             db_config: Database configuration instance for profile management
             host: Host to bind the health API to
             port: Port to bind the health API to
+            max_db_connections: Pooled connections the probes may hold at once;
+                must not exceed the connections reserved for this API
         """
         self.db_service = db_service
         self.db_config = db_config
@@ -38,12 +42,30 @@ class HealthAPI:
         self.start_time = datetime.now()
         self.request_count = 0
         self.error_count = 0
+        # Probes beyond the reserve would take connections the tool executor
+        # counts on, so they wait here instead of at the pool
+        self._db_slots = threading.BoundedSemaphore(max(1, max_db_connections))
 
         # Set up database manager
         if db_config:
             database_manager.set_config(db_config, db_service)
 
         self._setup_routes()
+
+    def attach_database(self, db_service, db_config=None):
+        """Attach the database once it is connected.
+
+        Lets the API start serving before the database pool is up; until
+        then readiness reports 503.
+
+        Args:
+            db_service: Connected database service instance
+            db_config: Database configuration instance for profile management
+        """
+        self.db_service = db_service
+        self.db_config = db_config
+        if db_config:
+            database_manager.set_config(db_config, db_service)
         
     def _setup_routes(self):
         """Set up FastAPI routes for health monitoring."""
@@ -79,8 +101,7 @@ class HealthAPI:
             
             try:
                 # Test database connection
-                result = self.db_service.execute_query("SELECT 1 as health")
-                is_healthy = result[0]['health'] == 1
+                is_healthy = self._probe_database()
                 
                 # Get pool stats
                 pool_stats = {
@@ -161,13 +182,18 @@ class HealthAPI:
                 logger.error(f"Failed to list database profiles: {e}")
                 raise HTTPException(status_code=500, detail=str(e))
 
-        @self.app.get("/api/database/current")
-        async def get_current_profile() -> Dict[str, Any]:
+        @self.app.get("/api/database/current", response_model=None)
+        async def get_current_profile() -> Union[Response, Dict[str, Any]]:
             """Get information about the current database profile."""
             try:
                 profile_info = database_manager.get_current_profile_info()
                 if profile_info:
-                    return profile_info.dict()
+                    # Serialize straight to JSON bytes in pydantic-core rather
+                    # than building a dict (or str) for FastAPI to encode again
+                    return Response(
+                        content=profile_info.__pydantic_serializer__.to_json(profile_info),
+                        media_type="application/json"
+                    )
                 else:
                     return {"status": "no_profile", "message": "No database profile configured"}
             except Exception as e:
@@ -257,12 +283,31 @@ class HealthAPI:
             return False
 
         try:
-            result = self.db_service.execute_query("SELECT 1 as health")
-            return result[0]['health'] == 1
+            return self._probe_database()
         except Exception as e:
             logger.error(f"Database health check failed: {e}")
             return False
 
+    def _probe_database(self, timeout: float = 5.0) -> bool:
+        """Run the health query on one of the reserved connections.
+
+        Args:
+            timeout: Seconds to wait for a free reserved connection
+
+        Returns:
+            True if the database answered the probe
+
+        Raises:
+            TimeoutError: If every reserved connection stays busy
+        """
+        if not self._db_slots.acquire(timeout=timeout):
+            raise TimeoutError("All health API database connections are busy")
+        try:
+            result = self.db_service.execute_query("SELECT 1 as health")
+            return result[0]['health'] == 1
+        finally:
+            self._db_slots.release()
+
     async def _test_profile_connection(self, profile_name: str, timeout: int = 10) -> DatabaseConnectionTestResponse:
         """Test connection to a specific database profile.
 
@@ -3,6 +3,10 @@
 import re
 from typing import Optional
 
+# Identifier patterns, compiled once at import
+_TABLE_NAME_RE = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*(\.[a-zA-Z_][a-zA-Z0-9_]*)?$')
+_IDENTIFIER_RE = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
+
 
 def validate_table_name(table_name: str) -> bool:
     """Validate table name to prevent SQL injection.
@@ -14,8 +18,7 @@ def validate_table_name(table_name: str) -> bool:
         True if valid, False otherwise
     """
     # Allow alphanumeric, underscore, and dot (for schema.table)
-    pattern = r'^[a-zA-Z_][a-zA-Z0-9_]*(\.[a-zA-Z_][a-zA-Z0-9_]*)?$'
-    return bool(re.match(pattern, table_name))
+    return bool(_TABLE_NAME_RE.match(table_name))
 
 
 def validate_schema_name(schema_name: str) -> bool:
@@ -28,8 +31,7 @@ def validate_schema_name(schema_name: str) -> bool:
         True if valid, False otherwise
     """
     # Allow alphanumeric and underscore
-    pattern = r'^[a-zA-Z_][a-zA-Z0-9_]*$'
-    return bool(re.match(pattern, schema_name))
+    return bool(_IDENTIFIER_RE.match(schema_name))
 
 
 def validate_column_name(column_name: str) -> bool:
@@ -42,8 +44,7 @@ def validate_column_name(column_name: str) -> bool:
         True if valid, False otherwise
     """
     # Allow alphanumeric and underscore
-    pattern = r'^[a-zA-Z_][a-zA-Z0-9_]*$'
-    return bool(re.match(pattern, column_name))
+    return bool(_IDENTIFIER_RE.match(column_name))
 
 
 def escape_identifier(identifier: str) -> str:
@@ -1,9 +1,16 @@
 """Transport implementations for MCP server."""
 
 from .stdio_server import StdioTransport
-from .sse_server import SSETransport
 
 __all__ = [
     'StdioTransport',
     'SSETransport'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # The SSE transport pulls in FastAPI and uvicorn; stdio doesn't need them
+    if name == 'SSETransport':
+        from .sse_server import SSETransport
+        return SSETransport
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,16 +1,119 @@
 """Server-Sent Events (SSE) transport for MCP server."""
 
+import inspect
 import json
 import logging
-from typing import Dict, Any
+from decimal import Decimal
+from typing import Dict, Any, Optional
 from fastapi import FastAPI, Request
 from fastapi.responses import StreamingResponse
 from fastmcp import FastMCP
 import uvicorn
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _json_default(obj: Any) -> Any:
+    """Encode values the JSON encoders do not know natively.
+
+    Decimals (numeric columns) are sent as strings so no precision is lost.
+    """
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _encode(obj: Any, indent: bool = False) -> bytes:
+    """Serialize a value to JSON bytes, with orjson when available.
+
+    orjson emits non-ASCII as-is (matching ``ensure_ascii=False``) and
+    NaN/Infinity as ``null``. It rejects integers wider than 64 bits, so
+    those payloads are re-encoded with the stdlib encoder instead.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS if indent else 0
+        try:
+            return orjson.dumps(obj, default=_json_default, option=option)
+        except orjson.JSONEncodeError:
+            logger.debug("orjson could not encode payload, using stdlib json")
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None,
+                      default=_json_default).encode()
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a value to a JSON string for embedding in SSE error events."""
+    return _encode(obj).decode()
+
+
+def _dumps_indented(obj: Any) -> str:
+    """Serialize a tool result to indented JSON text for MCP content.
+
+    Two-space indentation matches ``json.dumps(indent=2)``; non-string
+    keys are stringified as the stdlib does.
+    """
+    return _encode(obj, indent=True).decode()
+
+
+def _data_event(obj: Any) -> bytes:
+    """Frame an object as an SSE data event, ready to write to the stream.
+
+    The payload is already bytes, so the frame is built without a str
+    round-trip and StreamingResponse passes it through unencoded.
+    """
+    return b"data: " + _encode(obj) + b"\n\n"
+
+
+def _loads(data: bytes) -> Any:
+    """Deserialize a raw JSON request body.
+
+    orjson parses bytes directly; the stdlib fallback accepts bytes too.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class MethodNotFoundError(ValueError):
+    """Requested tool does not exist or cannot be called."""
+
+
+class InvalidParamsError(TypeError):
+    """Request params do not match the tool's signature."""
+
+
+# JSON-RPC error events differ only in id, code, message and data, so the
+# frame around them is fixed and only those values need to be encoded.
+_ERROR_EVENT_TEMPLATE = (
+    'data: {{"jsonrpc":"2.0","id":{id},"error":'
+    '{{"code":{code},"message":{message},"data":{data}}}}}\n\n'
+)
+
+
+def _error_event(request_id: Any, code: int, message: str, data: str) -> str:
+    """Format a JSON-RPC error response as an SSE event.
+
+    Args:
+        request_id: JSON-RPC request id (may be None)
+        code: JSON-RPC error code
+        message: Short error message
+        data: Additional error details
+
+    Returns:
+        SSE event string containing the error response
+    """
+    return _ERROR_EVENT_TEMPLATE.format(
+        id=_dumps(request_id),
+        code=code,
+        message=_dumps(message),
+        data=_dumps(data)
+    )
+
+
 class SSETransport:
     """MCP server transport using Server-Sent Events over HTTP."""
     
@@ -29,13 +132,14 @@ class SSETransport:
         self.app = FastAPI(title="MCP SSE Server")
         # Store tool functions passed from the MCP server
         self.tools = tools_dict or {}
+        self._tool_listing: Optional[Dict[str, Any]] = None
         self._setup_routes()
         
     def _setup_routes(self):
         """Set up FastAPI routes for SSE transport."""
         
         @self.app.get("/")
-        async def root():
+        async def root() -> Dict[str, Any]:
             """Root endpoint for health check."""
             return {"status": "MCP SSE Server Running", "transport": "sse"}
         
@@ -47,94 +151,107 @@ class SSETransport:
             """
             # Read request body before creating generator
             try:
-                body = await request.json()
-            except Exception as e:
+                body = _loads(await request.body())
+            except ValueError as e:
                 logger.error(f"Failed to parse request body: {e}")
                 body = {}
-            
-            async def event_generator():
-                try:
-                    # Process through MCP
-                    if "method" in body:
-                        # Handle MCP tool invocation
-                        method = body.get("method")
-                        params = body.get("params", {})
-                        id = body.get("id")
-                        
-                        # Find and execute the tool
-                        tool_response = await self._execute_tool(method, params)
-                        
-                        # Format as JSON-RPC response
-                        response = {
-                            "jsonrpc": "2.0",
-                            "id": id,
-                            "result": tool_response
-                        }
-                        
-                        # Send as SSE event
-                        yield f"data: {json.dumps(response)}\n\n"
-                    else:
-                        # No method specified
-                        error_response = {
-                            "jsonrpc": "2.0",
-                            "id": body.get("id"),
-                            "error": {
-                                "code": -32600,
-                                "message": "Invalid Request",
-                                "data": "No method specified"
-                            }
-                        }
-                        yield f"data: {json.dumps(error_response)}\n\n"
-                    
-                except Exception as e:
-                    import traceback
-                    error_details = traceback.format_exc()
-                    logger.error(f"SSE request error: {str(e)}\nTraceback: {error_details}")
-                    error_response = {
-                        "jsonrpc": "2.0",
-                        "id": body.get("id") if body else None,
-                        "error": {
-                            "code": -32603,
-                            "message": "Internal error",
-                            "data": str(e)
-                        }
-                    }
-                    yield f"data: {json.dumps(error_response)}\n\n"
+            if not isinstance(body, dict):
+                body = {}
+            request_id = body.get("id")
             
             return StreamingResponse(
-                event_generator(),
+                self._event_stream(body, request_id),
                 media_type="text/event-stream",
+                # no-transform stops proxies from compressing the stream,
+                # which would make them buffer events before forwarding
                 headers={
-                    "Cache-Control": "no-cache",
+                    "Cache-Control": "no-cache, no-transform",
                     "Connection": "keep-alive",
                     "X-Accel-Buffering": "no"
                 }
             )
         
         @self.app.get("/mcp/v1/tools")
-        async def list_tools():
+        async def list_tools() -> Dict[str, Any]:
             """List available MCP tools."""
-            tools = []
-            for tool_name, tool_func in self.tools.items():
-                # Get description from various sources
-                description = ""
-                short_desc = "No description available"
-
-                # Try to get description from different attributes
-                if hasattr(tool_func, '__doc__') and tool_func.__doc__:
-                    description = tool_func.__doc__
-                    short_desc = description.strip().split('\n')[0]
-                elif hasattr(tool_func, 'description') and isinstance(tool_func.description, str):
-                    description = tool_func.description
-                    short_desc = description.strip().split('\n')[0] if description else "No description available"
-
-                tools.append({
-                    "name": tool_name,
-                    "description": short_desc,
-                    "full_doc": description  # Include full documentation if needed
-                })
-            return {"tools": tools}
+            # Tool descriptions don't change after registration, so the
+            # listing is built on first request and reused
+            if self._tool_listing is None:
+                self._tool_listing = self._build_tool_listing()
+            return self._tool_listing
+
+    def _build_tool_listing(self) -> Dict[str, Any]:
+        """Build the tool listing served by /mcp/v1/tools.
+
+        Returns:
+            Dictionary with a list of tool names and descriptions
+        """
+        tools = []
+        for tool_name, tool_func in self.tools.items():
+            # Get description from various sources
+            description = ""
+            short_desc = "No description available"
+
+            # Try to get description from different attributes
+            if hasattr(tool_func, '__doc__') and tool_func.__doc__:
+                description = tool_func.__doc__
+                short_desc = description.strip().split('\n')[0]
+            elif hasattr(tool_func, 'description') and isinstance(tool_func.description, str):
+                description = tool_func.description
+                short_desc = description.strip().split('\n')[0] if description else "No description available"
+
+            tools.append({
+                "name": tool_name,
+                "description": short_desc,
+                "full_doc": description  # Include full documentation if needed
+            })
+        return {"tools": tools}
     
+    async def _event_stream(self, body: Dict[str, Any], request_id: Any):
+        """Execute a JSON-RPC request and yield its SSE events.
+
+        Args:
+            body: Decoded JSON-RPC request
+            request_id: JSON-RPC request id (may be None)
+
+        Yields:
+            SSE event frames for the response or error
+        """
+        try:
+            # Process through MCP
+            method = body.get("method")
+            if method is not None:
+                # Handle MCP tool invocation
+                params = body.get("params", {})
+                
+                # Find and execute the tool
+                tool_response = await self._execute_tool(method, params)
+                
+                # Format as JSON-RPC response
+                response = {
+                    "jsonrpc": "2.0",
+                    "id": request_id,
+                    "result": tool_response
+                }
+                
+                # Send as SSE event
+                yield _data_event(response)
+            else:
+                # No method specified
+                yield _error_event(request_id, -32600,
+                                   "Invalid Request", "No method specified")
+            
+        except MethodNotFoundError as e:
+            logger.warning(f"SSE request for unavailable method: {e}")
+            yield _error_event(request_id, -32601, "Method not found", str(e))
+        except InvalidParamsError as e:
+            logger.warning(f"SSE request with invalid params: {e}")
+            yield _error_event(request_id, -32602, "Invalid params", str(e))
+        except Exception as e:
+            logger.exception(f"SSE request error: {e}")
+            yield _error_event(request_id, -32603,
+                               "Internal error", str(e))
+
     async def _execute_tool(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute an MCP tool.
         
@@ -146,12 +263,11 @@ class SSETransport:
             Tool execution result formatted for MCP protocol
         """
         # Remove 'tools/' prefix if present
-        if method.startswith("tools/"):
-            method = method[6:]
+        method = method.removeprefix("tools/")
         
         # Find the tool in our tools dict
-        if method in self.tools:
-            tool_func = self.tools[method]
+        tool_func = self.tools.get(method)
+        if tool_func is not None:
             # Execute the tool with parameters
             # Handle both FunctionTool objects and raw functions
             if hasattr(tool_func, 'func'):
@@ -161,8 +277,17 @@ class SSETransport:
                 # Already a callable function
                 actual_func = tool_func
             else:
-                raise ValueError(f"Tool {method} is not callable")
-            
+                raise MethodNotFoundError(f"Tool {method} is not callable")
+
+            # Only a mismatch with the tool signature is an invalid-params
+            # error; TypeErrors raised while the tool runs are internal errors
+            if not isinstance(params, dict):
+                raise InvalidParamsError("Params must be an object")
+            try:
+                inspect.signature(actual_func).bind(**params)
+            except TypeError as e:
+                raise InvalidParamsError(str(e)) from e
+
             result = await actual_func(**params)
             
             # Format result for MCP protocol
@@ -170,24 +295,19 @@ class SSETransport:
                 if 'error' in result:
                     # Return errors as-is
                     return result
-                else:
-                    # Wrap successful results in content field for MCP protocol
-                    return {
-                        "content": [{
-                            "type": "text",
-                            "text": json.dumps(result, indent=2) if isinstance(result, dict) else str(result)
-                        }]
-                    }
+                text = _dumps_indented(result)
             else:
-                # Wrap non-dict results
-                return {
-                    "content": [{
-                        "type": "text", 
-                        "text": str(result)
-                    }]
-                }
+                text = str(result)
+
+            # Wrap results in content field for MCP protocol
+            return {
+                "content": [{
+                    "type": "text",
+                    "text": text
+                }]
+            }
         else:
-            raise ValueError(f"Unknown tool: {method}")
+            raise MethodNotFoundError(f"Unknown tool: {method}")
     
     def run(self):
         """Run the SSE transport server."""
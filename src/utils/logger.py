@@ -123,10 +123,14 @@ def log_function_call(func):
     """Decorator to log function calls with arguments."""
     def wrapper(*args, **kwargs):
         func_logger = get_logger(func.__module__)
-        func_logger.debug(f"Calling {func.__name__} with args={args}, kwargs={kwargs}")
+        # Formatting args/results can be costly, so only do it when logged
+        debug_enabled = func_logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            func_logger.debug(f"Calling {func.__name__} with args={args}, kwargs={kwargs}")
         try:
             result = func(*args, **kwargs)
-            func_logger.debug(f"{func.__name__} returned: {result}")
+            if debug_enabled:
+                func_logger.debug(f"{func.__name__} returned: {result}")
             return result
         except Exception as e:
             func_logger.error(f"{func.__name__} raised {e.__class__.__name__}: {e}")
@@ -145,6 +149,10 @@ def log_database_query(query: str, params: Optional[tuple] = None, logger_instan
     if logger_instance is None:
         logger_instance = logger
 
+    # Skip the truncation/normalization work entirely unless it will be logged
+    if not logger_instance.isEnabledFor(logging.DEBUG):
+        return
+
     # Truncate very long queries
     display_query = query[:500] + "..." if len(query) > 500 else query
     display_query = ' '.join(display_query.split())  # Normalize whitespace
@@ -10,6 +10,7 @@ Provides common functionality for all MCP test clients including:
 import json
 import sys
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Tuple
 from dataclasses import dataclass
@@ -23,6 +24,27 @@ from mcp.client.sse import sse_client
 from mcp.client.stdio import stdio_client, StdioServerParameters
 
 
+TOOL_CATEGORIES_PATH = Path(__file__).parent.parent.parent / "src/lib/tools/tool_categories.yaml"
+
+
+@lru_cache(maxsize=None)
+def load_tool_categories() -> Optional[Dict[str, Any]]:
+    """Load tool categories from src/lib/tools/tool_categories.yaml once.
+
+    Returns:
+        Parsed categories data, or None if the file could not be loaded
+    """
+    try:
+        with open(TOOL_CATEGORIES_PATH, 'r') as f:
+            return yaml.safe_load(f) or {}
+    except FileNotFoundError:
+        print(f"⚠️  Tool categories file not found at {TOOL_CATEGORIES_PATH}")
+        return None
+    except Exception as e:
+        print(f"⚠️  Error loading tool categories: {e}")
+        return None
+
+
 class TestStatus(Enum):
     """Test execution status"""
     PASSED = "passed"
@@ -59,7 +81,7 @@ class BaseTestMCP:
 
         # Session management
         self.session: Optional[ClientSession] = None
-        self.available_tools: List[Dict[str, Any]] = []
+        self.available_tools = []
         self._streams_context = None
         self._session_context = None
 
@@ -74,6 +96,17 @@ class BaseTestMCP:
         if transport == "sse":
             self.mcp_url = f"http://localhost:{port}/sse"
 
+    @property
+    def available_tools(self) -> List[Dict[str, Any]]:
+        """Tools reported by the server, in server order."""
+        return self._available_tools
+
+    @available_tools.setter
+    def available_tools(self, tools: List[Dict[str, Any]]):
+        # Index by name so lookups don't rescan the tool list
+        self._available_tools = tools
+        self._tools_by_name = {tool["name"]: tool for tool in tools}
+
     async def connect(self) -> bool:
         """Connect to MCP server.
 
@@ -110,7 +143,7 @@ class BaseTestMCP:
             tools = response.tools
 
             # Convert to standardized format
-            self.available_tools = []
+            available_tools = []
             for tool in tools:
                 tool_info = {
                     "name": tool.name,
@@ -121,7 +154,8 @@ class BaseTestMCP:
                         "required": []
                     }
                 }
-                self.available_tools.append(tool_info)
+                available_tools.append(tool_info)
+            self.available_tools = available_tools
 
             self.connected = True
             return True
@@ -148,23 +182,24 @@ class BaseTestMCP:
         Returns:
             Parsed result as dictionary
         """
-        if hasattr(result, 'content'):
-            content = result.content
-            if isinstance(content, list):
-                for item in content:
-                    if hasattr(item, 'text'):
-                        try:
-                            return json.loads(item.text)
-                        except json.JSONDecodeError:
-                            return {"raw": item.text}
-            elif hasattr(content, 'text'):
-                try:
-                    return json.loads(content.text)
-                except json.JSONDecodeError:
-                    return {"raw": content.text}
-            else:
+        content = getattr(result, 'content', None)
+        if content is None:
+            return {"raw": result}
+
+        if isinstance(content, list):
+            # Tool results carry their payload in the first text item
+            text = next((item.text for item in content if getattr(item, 'type', None) == 'text'), None)
+            if text is None:
+                return {"raw": result}
+        else:
+            text = getattr(content, 'text', None)
+            if text is None:
                 return {"raw": content}
-        return {"raw": result}
+
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            return {"raw": text}
 
     async def call_tool(self, tool_name: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """Call an MCP tool with tracking and limiting.
@@ -238,10 +273,7 @@ class BaseTestMCP:
         Returns:
             Tool information or None if not found
         """
-        for tool in self.available_tools:
-            if tool["name"] == name:
-                return tool
-        return None
+        return self._tools_by_name.get(name)
 
     def has_tool(self, name: str) -> bool:
         """Check if a tool is available.
@@ -265,17 +297,9 @@ class BaseTestMCP:
         Returns:
             List of tools in the category
         """
-        # Load tool categories from YAML file
-        yaml_path = Path(__file__).parent.parent.parent / "src/lib/tools/tool_categories.yaml"
-
-        try:
-            with open(yaml_path, 'r') as f:
-                categories_data = yaml.safe_load(f)
-        except FileNotFoundError:
-            print(f"⚠️  Tool categories file not found at {yaml_path}")
-            return []
-        except Exception as e:
-            print(f"⚠️  Error loading tool categories: {e}")
+        # Tool categories are parsed once and shared across testers
+        categories_data = load_tool_categories()
+        if categories_data is None:
             return []
 
         # Get tools for the requested category
@@ -283,7 +307,7 @@ class BaseTestMCP:
         if category not in tool_categories:
             return []
 
-        category_tools = tool_categories[category].get('tools', [])
+        category_tools = set(tool_categories[category].get('tools', []))
 
         # Find matching available tools
         tools = []
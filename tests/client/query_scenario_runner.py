@@ -8,13 +8,34 @@ import json
 import yaml
 import time
 import asyncio
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
 from .base_test_mcp import BaseTestMCP, TestResult, TestStatus
-from openai import AsyncOpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+
+@lru_cache(maxsize=None)
+def _get_http_client() -> httpx.AsyncClient:
+    """Get the keep-alive HTTP client shared by all OpenAI clients."""
+    return DefaultAsyncHttpxClient(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    )
+
+
+@lru_cache(maxsize=None)
+def get_openai_client(api_key: str) -> AsyncOpenAI:
+    """Get a shared OpenAI client for an API key.
+
+    Reusing one client keeps its HTTP connection pool alive across
+    scenarios and runners instead of reconnecting for each one. Clients
+    for different keys share a single connection pool.
+    """
+    return AsyncOpenAI(api_key=api_key, http_client=_get_http_client())
 
 
 @dataclass
@@ -64,6 +85,10 @@ class QueryScenarioRunner(BaseTestMCP):
         self.openai = None
         self.messages: List[Dict[str, Any]] = []
 
+        # OpenAI-format tool definitions, cached per available_tools list
+        self._openai_tools: List[Dict[str, Any]] = []
+        self._openai_tools_source: Optional[List[Dict[str, Any]]] = None
+
     def _load_config(self, config_path: Path) -> Dict[str, Any]:
         """Load test configuration from YAML file"""
         try:
@@ -93,7 +118,7 @@ class QueryScenarioRunner(BaseTestMCP):
         """Setup OpenAI client for LLM integration"""
         if api_key:
             llm_config = self.config.get("llm_settings", {})
-            self.openai = AsyncOpenAI(api_key=api_key)
+            self.openai = get_openai_client(api_key)
             print(f"✅ OpenAI client configured with model: {llm_config.get('model', 'gpt-4o-mini')}")
         else:
             print("⚠️  No OpenAI API key provided, scenario tests will be limited")
@@ -200,32 +225,45 @@ class QueryScenarioRunner(BaseTestMCP):
             print(f"❌ {error_msg}")
             return False
 
+    def _get_openai_tools(self) -> List[Dict[str, Any]]:
+        """Convert available tools to OpenAI format.
+
+        The conversion is cached until available_tools is replaced, so
+        repeated LLM calls against the same tool set reuse it.
+        """
+        if self._openai_tools_source is not self.available_tools:
+            self._openai_tools = [
+                {
+                    "type": "function",
+                    "function": {
+                        "name": tool["name"],
+                        "description": tool["description"] or f"Tool: {tool['name']}",
+                        "parameters": tool["input_schema"]
+                    }
+                }
+                for tool in self.available_tools
+            ]
+            self._openai_tools_source = self.available_tools
+        return self._openai_tools
+
     async def _call_llm_with_tools(self, scenario_config: Dict) -> Optional[str]:
         """Call LLM with tool integration"""
         llm_config = self.config.get("llm_settings", {})
+        model = llm_config.get("model", "gpt-4o-mini")
+        temperature = llm_config.get("temperature", 0.3)
+        max_tokens = llm_config.get("max_tokens", 1500)
 
-        # Convert available tools to OpenAI format
-        openai_tools = []
-        for tool in self.available_tools:
-            openai_tool = {
-                "type": "function",
-                "function": {
-                    "name": tool["name"],
-                    "description": tool["description"] or f"Tool: {tool['name']}",
-                    "parameters": tool["input_schema"]
-                }
-            }
-            openai_tools.append(openai_tool)
+        openai_tools = self._get_openai_tools()
 
         try:
             # Call OpenAI
             response = await self.openai.chat.completions.create(
-                model=llm_config.get("model", "gpt-4o-mini"),
+                model=model,
                 messages=self.messages,
                 tools=openai_tools,
                 tool_choice=llm_config.get("tool_choice", "auto"),
-                temperature=llm_config.get("temperature", 0.3),
-                max_tokens=llm_config.get("max_tokens", 1500)
+                temperature=temperature,
+                max_tokens=max_tokens
             )
 
             assistant_message = response.choices[0].message
@@ -256,10 +294,10 @@ class QueryScenarioRunner(BaseTestMCP):
 
                 # Get final response with tool results
                 final_response = await self.openai.chat.completions.create(
-                    model=llm_config.get("model", "gpt-4o-mini"),
+                    model=model,
                     messages=self.messages,
-                    temperature=llm_config.get("temperature", 0.3),
-                    max_tokens=llm_config.get("max_tokens", 1500)
+                    temperature=temperature,
+                    max_tokens=max_tokens
                 )
 
                 final_message = final_response.choices[0].message
@@ -291,72 +329,62 @@ class QueryScenarioRunner(BaseTestMCP):
         if not assistant_message.tool_calls:
             return []
 
-        tool_results = []
+        # Run tool calls one at a time, in order: a safe_read_query may rely
+        # on an inspect_table_schema issued earlier in the same turn
+        return [await self._handle_tool_call(tool_call)
+                for tool_call in assistant_message.tool_calls]
 
-        for tool_call in assistant_message.tool_calls:
-            tool_name = tool_call.function.name
+    async def _handle_tool_call(self, tool_call) -> Dict[str, str]:
+        """Execute a single LLM tool call and return its tool message"""
+        tool_name = tool_call.function.name
 
-            try:
-                tool_args = json.loads(tool_call.function.arguments)
-            except json.JSONDecodeError:
-                tool_args = {}
+        try:
+            tool_args = json.loads(tool_call.function.arguments)
+        except json.JSONDecodeError:
+            tool_args = {}
 
-            print(f"   🔧 Calling tool: {tool_name}")
+        print(f"   🔧 Calling tool: {tool_name}")
 
-            # Enhanced debug output for tool arguments
-            if tool_args:
-                args_preview = json.dumps(tool_args, indent=2)[:200]
-                if len(args_preview) > 200:
-                    args_preview += "..."
-                print(f"      📋 Arguments: {args_preview}")
+        # Enhanced debug output for tool arguments
+        if tool_args:
+            args_preview = json.dumps(tool_args, indent=2)[:200]
+            if len(args_preview) > 200:
+                args_preview += "..."
+            print(f"      📋 Arguments: {args_preview}")
 
-            try:
-                # Call the tool (this will respect our limits)
-                result = await self.call_tool(tool_name, tool_args)
+        try:
+            # Call the tool (this will respect our limits)
+            result = await self.call_tool(tool_name, tool_args)
 
-                # Convert result to string for LLM
-                tool_result = json.dumps(result, indent=2) if result else "No result"
+            # Convert result to string for LLM
+            tool_result = json.dumps(result, indent=2) if result else "No result"
 
-                # Enhanced debug output for tool results
-                result_preview = tool_result[:300]
-                if len(tool_result) > 300:
-                    result_preview += "...(truncated for display)"
-                print(f"      ✅ Result preview: {result_preview}")
+            # Enhanced debug output for tool results
+            result_preview = tool_result[:300]
+            if len(tool_result) > 300:
+                result_preview += "...(truncated for display)"
+            print(f"      ✅ Result preview: {result_preview}")
 
-                # Limit result size
-                if len(tool_result) > 2000:
-                    tool_result = tool_result[:2000] + "\n...(truncated)"
+            # Limit result size
+            if len(tool_result) > 2000:
+                tool_result = tool_result[:2000] + "\n...(truncated)"
 
-                # Collect tool result
-                tool_results.append({
-                    "role": "tool",
-                    "tool_call_id": tool_call.id,
-                    "content": tool_result
-                })
+            content = tool_result
 
-            except RuntimeError as e:
-                if "Tool call limit exceeded" in str(e):
-                    print(f"⚠️  Tool call limit reached, stopping scenario")
-                    tool_results.append({
-                        "role": "tool",
-                        "tool_call_id": tool_call.id,
-                        "content": f"Tool call limit exceeded: {str(e)}"
-                    })
-                    break
-                else:
-                    tool_results.append({
-                        "role": "tool",
-                        "tool_call_id": tool_call.id,
-                        "content": f"Tool error: {str(e)}"
-                    })
-            except Exception as e:
-                tool_results.append({
-                    "role": "tool",
-                    "tool_call_id": tool_call.id,
-                    "content": f"Tool error: {str(e)}"
-                })
+        except RuntimeError as e:
+            if "Tool call limit exceeded" in str(e):
+                print(f"⚠️  Tool call limit reached, stopping scenario")
+                content = f"Tool call limit exceeded: {str(e)}"
+            else:
+                content = f"Tool error: {str(e)}"
+        except Exception as e:
+            content = f"Tool error: {str(e)}"
 
-        return tool_results
+        return {
+            "role": "tool",
+            "tool_call_id": tool_call.id,
+            "content": content
+        }
 
     def _validate_scenario_results(self, scenario_config: Dict, result: ScenarioResult):
         """Validate scenario results against expected outcomes"""
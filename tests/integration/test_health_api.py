@@ -3,6 +3,8 @@
 import pytest
 import sys
 import os
+import threading
+import time
 from unittest.mock import Mock, patch
 from datetime import datetime
 from fastapi.testclient import TestClient
@@ -158,7 +160,59 @@ class TestHealthAPI:
         
         assert response.status_code == 503
         assert "database connection unavailable" in response.json()["detail"]
-    
+
+    def test_readiness_after_attach_database(self, mock_db_service):
+        """Test /health/ready turns ready once the database is attached."""
+        health_api = HealthAPI()
+        client = TestClient(health_api.app)
+
+        assert client.get("/health/ready").status_code == 503
+        assert client.get("/health/live").status_code == 200
+
+        health_api.attach_database(mock_db_service)
+
+        assert health_api.db_service == mock_db_service
+        assert client.get("/health/ready").status_code == 200
+
+    def test_database_probes_stay_within_reserve(self, mock_db_service):
+        """Test concurrent probes never hold more connections than reserved."""
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def slow_query(query):
+            with lock:
+                active.append(query)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.pop()
+            return [{'health': 1}]
+
+        mock_db_service.execute_query.side_effect = slow_query
+        health_api = HealthAPI(db_service=mock_db_service, max_db_connections=1)
+
+        threads = [threading.Thread(target=health_api._probe_database) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert mock_db_service.execute_query.call_count == 4
+        assert max(peak) == 1
+
+    def test_database_probe_times_out_when_reserve_busy(self, mock_db_service):
+        """Test a probe reports busy instead of taking an extra connection."""
+        health_api = HealthAPI(db_service=mock_db_service, max_db_connections=1)
+        health_api._db_slots.acquire()
+        try:
+            with pytest.raises(TimeoutError):
+                health_api._probe_database(timeout=0.01)
+        finally:
+            health_api._db_slots.release()
+
+        mock_db_service.execute_query.assert_not_called()
+
     def test_liveness_check(self, mock_db_service):
         """Test /health/live endpoint."""
         health_api = HealthAPI(db_service=mock_db_service)
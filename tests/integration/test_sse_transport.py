@@ -5,13 +5,14 @@ import json
 import sys
 import os
 import asyncio
+from decimal import Decimal
 from unittest.mock import Mock, patch, AsyncMock
 from fastapi.testclient import TestClient
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
 
-from transport.sse_server import SSETransport
+from transport.sse_server import SSETransport, _data_event, _dumps_indented
 from fastmcp import FastMCP
 
 
@@ -144,6 +145,8 @@ class TestSSETransport:
         # SSE endpoints return streaming responses
         assert response.status_code == 200
         assert response.headers.get("content-type") == "text/event-stream; charset=utf-8"
+        assert response.headers.get("cache-control") == "no-cache, no-transform"
+        assert response.headers.get("x-accel-buffering") == "no"
     
     def test_sse_transport_error_handling(self, mock_mcp):
         """Test SSE transport error handling."""
@@ -166,7 +169,87 @@ class TestSSETransport:
         
         assert response.status_code == 200  # SSE always returns 200
         # Error will be in the SSE stream data
-    
+
+    def test_sse_transport_missing_method_error_event(self, mock_mcp):
+        """Test SSE transport emits a JSON-RPC error event when method is missing."""
+        transport = SSETransport(mock_mcp)
+        client = TestClient(transport.app)
+
+        response = client.post(
+            "/mcp/v1/sse",
+            json={"jsonrpc": "2.0", "id": 7},
+            headers={"Accept": "text/event-stream"}
+        )
+
+        assert response.status_code == 200
+        assert response.text.startswith("data: ")
+        event = json.loads(response.text[len("data: "):])
+        assert event["id"] == 7
+        assert event["error"]["code"] == -32600
+        assert event["error"]["data"] == "No method specified"
+
+    def test_sse_transport_unknown_method_error_event(self, mock_mcp):
+        """Test SSE transport reports unknown tools as JSON-RPC method not found."""
+        transport = SSETransport(mock_mcp)
+        client = TestClient(transport.app)
+
+        response = client.post(
+            "/mcp/v1/sse",
+            json={"jsonrpc": "2.0", "method": "nonexistent_tool", "params": {}, "id": 3},
+            headers={"Accept": "text/event-stream"}
+        )
+
+        event = json.loads(response.text[len("data: "):])
+        assert event["id"] == 3
+        assert event["error"]["code"] == -32601
+        assert "Unknown tool: nonexistent_tool" in event["error"]["data"]
+
+    def test_sse_transport_invalid_params_error_event(self, mock_mcp):
+        """Test SSE transport reports params that don't fit the tool as invalid params."""
+        async def list_tables(schema=None):
+            return {"tables": []}
+
+        transport = SSETransport(mock_mcp, tools_dict={"list_tables": list_tables})
+        client = TestClient(transport.app)
+
+        response = client.post(
+            "/mcp/v1/sse",
+            json={"jsonrpc": "2.0", "method": "list_tables", "params": {"bogus": 1}, "id": 4},
+            headers={"Accept": "text/event-stream"}
+        )
+
+        event = json.loads(response.text[len("data: "):])
+        assert event["error"]["code"] == -32602
+
+    def test_sse_transport_tool_failure_is_internal_error(self, mock_mcp):
+        """Test SSE transport reports errors raised inside a tool as internal errors."""
+        async def list_tables():
+            raise TypeError("unsupported operand")
+
+        transport = SSETransport(mock_mcp, tools_dict={"list_tables": list_tables})
+        client = TestClient(transport.app)
+
+        response = client.post(
+            "/mcp/v1/sse",
+            json={"jsonrpc": "2.0", "method": "list_tables", "params": {}, "id": 5},
+            headers={"Accept": "text/event-stream"}
+        )
+
+        event = json.loads(response.text[len("data: "):])
+        assert event["error"]["code"] == -32603
+        assert "unsupported operand" in event["error"]["data"]
+
+    def test_data_event_encodes_decimal_and_wide_integer(self):
+        """Test values orjson cannot encode natively still reach the stream."""
+        event = _data_event({"price": Decimal("12.3400"), "oid": 2 ** 70})
+
+        assert event.startswith(b"data: ") and event.endswith(b"\n\n")
+        assert json.loads(event[len(b"data: "):]) == {"price": "12.3400", "oid": 2 ** 70}
+
+    def test_indented_result_encodes_decimal(self):
+        """Test tool results with numeric columns serialize as strings."""
+        assert json.loads(_dumps_indented({"total": Decimal("1e-30")})) == {"total": "1E-30"}
+
     def test_sse_transport_with_real_mcp_instance(self):
         """Test SSE transport with a real FastMCP instance."""
         # Create a real FastMCP instance
@@ -18,7 +18,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from client.base_test_mcp import BaseTestMCP, TestResult, TestStatus
 from client.tool_testers import DatabaseToolTester, SchemaToolTester, TableToolTester, ObjectToolTester, QueryToolTester
-from openai import AsyncOpenAI
+from client.query_scenario_runner import get_openai_client
 from dotenv import load_dotenv
 
 # Load .env file from project root
@@ -45,7 +45,7 @@ class TestMCPRunner(BaseTestMCP):
             print(f"   - API Key: {self.api_key[:10]}...")
 
         # Initialize OpenAI client if API key is available
-        self.openai = AsyncOpenAI(api_key=self.api_key) if self.api_key else None
+        self.openai = get_openai_client(self.api_key) if self.api_key else None
         self.messages: List[Dict[str, Any]] = []
 
         # Initialize tool testers
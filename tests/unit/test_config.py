@@ -8,7 +8,7 @@ from unittest.mock import patch, Mock
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
 
-from models.config import DatabaseConfig
+from models.config import DatabaseConfig, DatabaseProfile, MIN_POOL_SIZE
 
 
 class TestDatabaseConfig:
@@ -21,7 +21,8 @@ class TestDatabaseConfig:
         'DB_USER': 'test_user',
         'DB_PASSWORD': 'test_pass',
         'DB_CONNECT_TIMEOUT': '30',
-        'DB_QUERY_TIMEOUT': '60'
+        'DB_QUERY_TIMEOUT': '60',
+        'DB_POOL_SIZE': '12'
     })
     def test_config_from_environment(self):
         """Test loading configuration from environment variables."""
@@ -34,7 +35,22 @@ class TestDatabaseConfig:
         assert config.password == 'test_pass'
         assert config.connect_timeout == 30
         assert config.query_timeout == 60
+        assert config.pool_size == 12
     
+    def test_pool_size_from_profile_options(self):
+        """Test that max_connections is cast to int and kept above the pool minimum."""
+        profile = DatabaseProfile('test', {'connection_options': {'max_connections': '7'}})
+        assert profile.pool_size == 7
+
+        profile = DatabaseProfile('test', {'connection_options': {'max_connections': 1}})
+        assert profile.pool_size == MIN_POOL_SIZE
+
+    def test_pool_size_invalid(self):
+        """Test that a non-numeric max_connections is rejected."""
+        profile = DatabaseProfile('test', {'connection_options': {'max_connections': 'many'}})
+        with pytest.raises(ValueError):
+            profile.pool_size
+
     @patch.dict(os.environ, {
         'DB_PASSWORD': 'test_pass'
     }, clear=True)
@@ -188,4 +204,12 @@ class TestDatabaseConfig:
         DatabaseConfig()
         
         # Verify load_dotenv was called
-        mock_load_dotenv.assert_called_once()
\ No newline at end of file
+        mock_load_dotenv.assert_called_once()
+
+    @patch('models.config.load_dotenv')
+    @patch.dict(os.environ, {'DB_PASSWORD': 'test_pass', 'DOCKER_ENV': 'true'})
+    def test_config_skips_dotenv_in_docker(self, mock_load_dotenv):
+        """Test that configuration skips the .env scan inside containers."""
+        DatabaseConfig()
+
+        mock_load_dotenv.assert_not_called()
\ No newline at end of file
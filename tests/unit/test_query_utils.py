@@ -3,6 +3,9 @@
 import pytest
 import sys
 import os
+from unittest.mock import Mock
+
+import psycopg2
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
@@ -164,4 +167,121 @@ class TestQueryUtils:
         # Reserved keywords (validation allows them, escaping handles safety)
         assert validate_table_name("select") is True
         assert validate_column_name("from") is True
-        assert escape_identifier("select") == '"select"'
\ No newline at end of file
+        assert escape_identifier("select") == '"select"'
+
+class TestPreparedSql:
+    """Unit tests for rewriting queries for server-side PREPARE."""
+
+    def test_placeholders_are_numbered(self):
+        """Test %s placeholders become positional parameters."""
+        from src.services.database_service import _to_prepared_sql
+
+        sql = "SELECT 1 FROM t WHERE a = %s AND b = %s"
+        assert _to_prepared_sql(sql) == "SELECT 1 FROM t WHERE a = $1 AND b = $2"
+
+    def test_literal_percent_is_unescaped(self):
+        """Test %% is turned back into a literal percent sign."""
+        from src.services.database_service import _to_prepared_sql
+
+        sql = "SELECT 1 FROM t WHERE a LIKE 'x%%' AND b = %s"
+        assert _to_prepared_sql(sql) == "SELECT 1 FROM t WHERE a LIKE 'x%' AND b = $1"
+
+    def test_escaped_percent_before_s_is_not_a_placeholder(self):
+        """Test %%s stays a literal %s and does not consume a parameter."""
+        from src.services.database_service import _to_prepared_sql
+
+        sql = "SELECT format('%%s', a) FROM t WHERE b = %s"
+        assert _to_prepared_sql(sql) == "SELECT format('%s', a) FROM t WHERE b = $1"
+
+
+class _FakeCursor:
+    """Cursor stand-in that records statements and fails on request."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.conn.executed.append(sql)
+        for prefix, error in self.conn.failures.items():
+            if sql.startswith(prefix):
+                raise error
+
+    def fetchall(self):
+        return [{'value': 1}]
+
+
+class _FakeConnection:
+    """Pooled connection stand-in with the prepared statement bookkeeping."""
+
+    def __init__(self):
+        self.closed = 0
+        self.executed = []
+        self.failures = {}
+        self.prepared_statements = set()
+        self.unpreparable_statements = set()
+        self.rollback = Mock()
+
+    def cursor(self, cursor_factory=None):
+        return _FakeCursor(self)
+
+
+class TestPreparedExecution:
+    """Unit tests for running named queries as server-side prepared statements."""
+
+    @pytest.fixture
+    def service(self):
+        """Create a database service backed by a single fake connection."""
+        from src.services.database_service import DatabaseService
+
+        service = DatabaseService({'query_timeout': 30})
+        service.conn = _FakeConnection()
+        service.pool = Mock()
+        service.pool.getconn.return_value = service.conn
+        return service
+
+    def _statements(self, conn, prefix):
+        return [sql for sql in conn.executed if sql.startswith(prefix)]
+
+    def test_prepares_once_per_connection(self, service):
+        """Test a repeated query is prepared once and executed each time."""
+        sql = "SELECT 1 FROM t WHERE a = %s"
+
+        for _ in range(2):
+            assert service.execute_readonly_query(sql, ('x',), prepare='mcp_test') == [{'value': 1}]
+
+        assert self._statements(service.conn, "PREPARE") == ["PREPARE mcp_test AS SELECT 1 FROM t WHERE a = $1"]
+        assert self._statements(service.conn, "EXECUTE") == ["EXECUTE mcp_test(%s)"] * 2
+
+    def test_failed_execute_keeps_statement_prepared(self, service):
+        """Test an EXECUTE failure does not make the next call prepare again."""
+        from src.models.error_types import MCPError
+
+        service.conn.failures["EXECUTE"] = psycopg2.Error("boom")
+        with pytest.raises(MCPError):
+            service.execute_readonly_query("SELECT 1", prepare='mcp_test')
+        service.conn.rollback.assert_called_once()
+
+        del service.conn.failures["EXECUTE"]
+        service.execute_readonly_query("SELECT 1", prepare='mcp_test')
+
+        assert len(self._statements(service.conn, "PREPARE")) == 1
+        assert len(self._statements(service.conn, "EXECUTE")) == 2
+
+    def test_failed_prepare_falls_back_without_retrying(self, service):
+        """Test a statement the server will not prepare runs unprepared."""
+        service.conn.failures["PREPARE"] = psycopg2.Error("could not determine data type")
+        sql = "SELECT %s"
+
+        for _ in range(2):
+            assert service.execute_readonly_query(sql, ('x',), prepare='mcp_test') == [{'value': 1}]
+
+        assert len(self._statements(service.conn, "PREPARE")) == 1
+        assert self._statements(service.conn, "ROLLBACK TO SAVEPOINT") == ["ROLLBACK TO SAVEPOINT mcp_prepare"]
+        assert self._statements(service.conn, "EXECUTE") == []
+        assert service.conn.executed.count(sql) == 2
@@ -0,0 +1,97 @@
+"""Unit tests for SQL query safety validation."""
+
+import pytest
+
+from src.lib.tools.query import (
+    validate_safe_sql, extract_table_names_from_query, is_plain_explain, normalize_sql
+)
+from src.models.error_types import InvalidQueryError
+
+
+class TestValidateSafeSql:
+    """Unit tests for validate_safe_sql."""
+
+    def test_select_allowed(self):
+        """Test that plain SELECT queries pass validation."""
+        validate_safe_sql("SELECT id, name FROM users WHERE id = 1")
+
+    def test_write_statements_blocked(self):
+        """Test that non-SELECT statements are rejected."""
+        for query in ["DELETE FROM users", "UPDATE users SET name = 'x'", "DROP TABLE users"]:
+            with pytest.raises(InvalidQueryError):
+                validate_safe_sql(query)
+
+    def test_dangerous_functions_blocked(self):
+        """Test that dangerous function calls are rejected, even when nested or qualified."""
+        dangerous_queries = [
+            "SELECT pg_read_file('/etc/passwd')",
+            "SELECT pg_catalog.pg_terminate_backend(123)",
+            "SELECT * FROM users WHERE id IN (SELECT lo_import('/tmp/x'))",
+            "EXPLAIN SELECT dblink_exec('conn', 'DELETE FROM users')",
+        ]
+
+        for query in dangerous_queries:
+            with pytest.raises(InvalidQueryError) as exc_info:
+                validate_safe_sql(query)
+            assert "forbidden function" in str(exc_info.value)
+
+    def test_function_names_in_identifiers_allowed(self):
+        """Test that columns named like dangerous functions are not rejected."""
+        validate_safe_sql("SELECT lo_import_date, pg_read_file_count FROM audit_log")
+
+
+class TestExtractTableNames:
+    """Unit tests for extract_table_names_from_query."""
+
+    def test_repeated_query_reuses_result(self):
+        """Test that identical SQL is parsed once and returns a frozen set."""
+        query = "SELECT * FROM orders o JOIN customers c ON c.id = o.customer_id"
+
+        first = extract_table_names_from_query(query)
+        second = extract_table_names_from_query(query)
+
+        assert first == {"orders", "customers"}
+        assert isinstance(first, frozenset)
+        assert second is first
+
+
+class TestIsPlainExplain:
+    """Unit tests for is_plain_explain."""
+
+    def test_plain_explain(self):
+        """Test that a plan-only EXPLAIN is recognised."""
+        assert is_plain_explain("  explain SELECT * FROM orders")
+        assert is_plain_explain("EXPLAIN (FORMAT JSON) SELECT * FROM orders")
+
+    def test_explain_analyze_and_select_excluded(self):
+        """Test that EXPLAIN ANALYZE and ordinary queries are not plain EXPLAINs."""
+        assert not is_plain_explain("EXPLAIN ANALYZE SELECT * FROM orders")
+        assert not is_plain_explain("EXPLAIN (ANALYZE, BUFFERS) SELECT * FROM orders")
+        assert not is_plain_explain("SELECT * FROM orders")
+        assert not is_plain_explain("EXPLAIN (ANALYZE false) SELECT * FROM orders")
+
+    def test_explain_followed_by_select_excluded(self):
+        """Test that an EXPLAIN cannot carry another statement past the checks."""
+        assert not is_plain_explain("EXPLAIN SELECT 1; SELECT * FROM users")
+        assert not is_plain_explain("SELECT * FROM users; EXPLAIN SELECT 1")
+        assert extract_table_names_from_query("EXPLAIN SELECT 1; SELECT * FROM users") == {"users"}
+
+    def test_unparseable_query_excluded(self):
+        """Test that text that does not parse is left to the normal checks."""
+        assert not is_plain_explain("EXPLAIN SELEC 1")
+
+
+class TestNormalizeSql:
+    """Unit tests for normalize_sql."""
+
+    def test_equivalent_spellings_match(self):
+        """Test that spacing, keyword case, comments and semicolons are ignored."""
+        first = normalize_sql("select a,b\n  from t -- note\n where x >= 1;")
+        second = normalize_sql("SELECT a, b FROM t WHERE x>=1")
+
+        assert first == second
+
+    def test_literals_preserved(self):
+        """Test that string literals and quoted identifiers are left untouched."""
+        assert "'A  b'" in normalize_sql("select \"Col\" from t where x = 'A  b'")
+        assert '"Col"' in normalize_sql("select \"Col\" from t where x = 'A  b'")